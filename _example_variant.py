@@ -14,9 +14,14 @@ from collections import Counter
 import statistics
 
 # Moinnee
+from src.bestiary import Bestiary
 from src.challengerating import get_cr_row
+from src.crfitter import CRFitter
+from src.crsweep import CRSweep
+from src.enumerators import MovementEnum, VariantSearchEnum
 from src.monster import MonsterWrapper
-from src.monstervariant import MonsterVariant
+from src.monstervariant import MonsterVariant, get_percentiles
+from src.settings import CR
 from src.universals import get_json_data, print_debug_dict
 
 # ARMOR
@@ -51,6 +56,21 @@ def get_count_input(text, minimum=0, maximum=1000):
                 return int(count)
 
 
+def get_cr_input(text):
+    """
+    Get CR input
+    """
+
+    while True:
+        cr = input(f"{text} ")
+        try:
+            cr = float(cr)
+        except ValueError:
+            continue
+        if get_cr_row(cr) is not None:
+            return int(cr) if cr >= 1 else cr
+
+
 def get_cumulative_information(monster):
     """
     Get Cumulative Information
@@ -80,6 +100,72 @@ def get_monster_input():
             return monster
 
 
+def option_benchmark_searches():
+    """
+    Compares how many CR evaluations each search takes per variant
+    """
+
+    # Get our Monster Data
+    monster = MONSTERS[get_monster_input()]
+
+    # How many we want?
+    count = max(get_count_input("How Many?"), 1)
+
+    # Same seeds and budget for every search, so they're comparable.
+    for search in [
+        VariantSearchEnum.RANDOM, VariantSearchEnum.GUIDED,
+        VariantSearchEnum.GENETIC
+    ]:
+        batch = list(MonsterVariant.create_many(
+            monster, count, WEAPONS, ARMOR, TRAITS, SPELLS,
+            search=search, max_iterations=5000, seed=0
+        ))
+        converged = sum(result.converged for result in batch)
+
+        # Misses are the CRs we had to work out, per variant we found.
+        per = max(converged, 1)
+        iterations = sum(result.iterations for result in batch) / per
+        misses = sum(result.cr_cache_misses for result in batch) / per
+        print(
+            f"{search.name}: Converged: {converged}/{count} "
+            f"Iterations: {iterations:.1f} CR Misses: {misses:.1f}"
+        )
+
+
+def option_check_bestiary_cr():
+    """
+    Checks Bestiary.get_cr against Monster.get_cr, as settings.CR has
+    it and with WALK weighed to push every monster off the bottom of the
+    table.
+    """
+
+    # All our monsters at once
+    bestiary = Bestiary(MONSTERS)
+
+    # As it is, then low rows.
+    walk = CR["MOVEMENT"][MovementEnum.WALK]
+    try:
+        for weight in [walk, -100]:
+            CR["MOVEMENT"][MovementEnum.WALK] = weight
+            crs, _, _ = bestiary.get_cr()
+            mismatches = 0
+            for name, cr in zip(bestiary.names, crs.tolist()):
+                MONSTERS[name].invalidate_cr()
+                monster_cr, _, _ = MONSTERS[name].get_cr()
+                if monster_cr != cr:
+                    print(
+                        f"{name}: Bestiary ({cr:g}) Monster ({monster_cr:g})"
+                    )
+                    mismatches += 1
+            print(f"WALK {weight:g}: Mismatches: {mismatches}")
+
+    # Put settings.CR back
+    finally:
+        CR["MOVEMENT"][MovementEnum.WALK] = walk
+        for monster in MONSTERS.values():
+            monster.invalidate_cr()
+
+
 def option_create_variant():
     """
     Create variant
@@ -95,16 +181,51 @@ def option_create_variant():
     if count < 1:
         count = 1
 
-    # Iterate!
-    for _ in range(count):
+    # Create them across our cores, printing as they finish.
+    batch = MonsterVariant.create_many(
+        monster, count, WEAPONS, ARMOR, TRAITS, SPELLS,
+        search=VariantSearchEnum.GUIDED, unique=True, instrument=True
+    )
+    for result in batch:
+        print(result.monster)
+        print(result)
+
+    # How many did we find, and where did the time go?
+    print(batch)
+    print(batch.stats.to_json(indent=4))
+
+
+def option_create_variant_ladder():
+    """
+    Create a variant at every CR
+    """
+
+    # Get our Monster Data
+    monster = MONSTERS[get_monster_input()]
+
+    # Create them across our cores, printing as they finish.
+    ladder = MonsterVariant.create_ladder(
+        monster, WEAPONS, ARMOR, TRAITS, SPELLS
+    )
+    for cr in ladder.unreachable:
+        print(f"Target CR: {cr} is out of reach")
+    for result in ladder:
+        print(f"Target CR: {result.target_cr} {result}")
+
+
+def option_fit_cr_settings():
+    """
+    Fits settings.CR to get our Monsters to their expected CR
+    """
+
+    # All our monsters at once, fit.
+    fit = CRFitter(Bestiary(MONSTERS)).fit()
+    print(fit)
 
-        # Create the Variant
-        variant_monster = MonsterVariant(
-            monster, WEAPONS, ARMOR, TRAITS, SPELLS
-            )
-        variant_monster.create()
-        print(variant_monster)
-        print(variant_monster._iterations)
+    # Who still misses, and by how many rows?
+    for name, residual in fit.residuals.items():
+        if residual:
+            print(f"{name}: {residual:+d} rows")
 
 
 def option_get_cr_accumulation():
@@ -113,16 +234,11 @@ def option_get_cr_accumulation():
     exists between all Monsters
     """
 
-    # Data to doodle
-    cr_total = Counter({})
-
-    # Iterate
-    for name in MONSTERS.keys():
-        _, cr_combined = get_cumulative_information(name)
-        cr_total += cr_combined
+    # All our monsters at once
+    bestiary = Bestiary(MONSTERS)
 
     # Print Debug
-    print_debug_dict(cr_total)
+    print_debug_dict(bestiary.get_cr_accumulation())
 
 
 def option_get_cr_calculation():
@@ -145,15 +261,13 @@ def option_get_cr_difference():
     Get CR Difference
     """
 
-    # Iterate and load the data
-    for key, value in MONSTERS.items():
+    # All our monsters at once
+    bestiary = Bestiary(MONSTERS)
 
-        cr, cr_combined = get_cumulative_information(key)
-
-        # Is this a different CR than expected?
-        if cr != value.expected_cr:
-            print(f"\n{key} Expected ({value.expected_cr}) Received ({cr})")
-            print_debug_dict(cr_combined)
+    # Those with a different CR than expected
+    for key, expected_cr, cr, cr_combined in bestiary.get_cr_differences():
+        print(f"\n{key} Expected ({expected_cr:g}) Received ({cr:g})")
+        print_debug_dict(cr_combined)
 
 
 def option_get_cr_tweaks():
@@ -198,6 +312,75 @@ def option_get_cr_tweaks():
         """
 
 
+def option_race_variant():
+    """
+    Compares the iterations of single searches against races of them
+    """
+
+    # Get our Monster Data
+    monster = MONSTERS[get_monster_input()]
+
+    # How many we want?
+    count = max(get_count_input("How Many?"), 1)
+
+    # Before, one search per variant.
+    batch = MonsterVariant.create_many(
+        monster, count, WEAPONS, ARMOR, TRAITS, SPELLS
+    )
+    before = get_percentiles([result.iterations for result in batch])
+
+    # After, racing searches with Luby restarts.
+    with MonsterVariant.create_race(
+        monster, WEAPONS, ARMOR, TRAITS, SPELLS, restart_unit=32
+    ) as race:
+        for _ in range(count):
+            race.run()
+        after = get_percentiles(race.iterations)
+
+    # How'd we do?
+    print(f"Before p50: {before[50]} p99: {before[99]}")
+    print(f"After  p50: {after[50]} p99: {after[99]}")
+
+
+def option_retarget_variant():
+    """
+    Create variants at another CR
+    """
+
+    # Get our Monster Data, and where we want it.
+    monster = MONSTERS[get_monster_input()]
+    target_cr = get_cr_input("Which CR?")
+
+    # How many we want?
+    count = max(get_count_input("How Many?"), 1)
+
+    # Create them across our cores, printing as they finish.
+    batch = MonsterVariant.create_many(
+        monster, count, WEAPONS, ARMOR, TRAITS, SPELLS,
+        search=VariantSearchEnum.GUIDED, unique=True, target_cr=target_cr
+    )
+    for result in batch:
+        print(result.monster)
+        print(result)
+
+    # How many did we find?
+    print(batch)
+
+
+def option_sweep_cr_settings():
+    """
+    Sweeps each settings.CR coefficient, saving how our Monsters' CRs move
+    """
+
+    # Every coefficient, across our cores.
+    sweep = CRSweep(Bestiary(MONSTERS))
+    print(sweep)
+
+    # Save it
+    sweep.save("cr_sweep.csv")
+    print("Saved cr_sweep.csv")
+
+
 def option_print_all_monsters():
     """
     Print all the monsters!
@@ -227,17 +410,29 @@ class Option():
 
 # Options
 options = [
+    Option("Benchmark Searches", option_benchmark_searches),
+    Option("Check Bestiary CR", option_check_bestiary_cr),
     Option("Create Variant", option_create_variant),
+    Option("Create Variant Ladder", option_create_variant_ladder),
+    Option("Fit CR Settings", option_fit_cr_settings),
     Option("Get CR Accumulation", option_get_cr_accumulation),
     Option("Get CR Calculation", option_get_cr_calculation),
     Option("Get CR Differences", option_get_cr_difference),
     Option("Get CR Tweaks", option_get_cr_tweaks),
     Option("Print Single Monster", option_print_single_monster),
-    Option("Print All Monsters", option_print_all_monsters)
+    Option("Print All Monsters", option_print_all_monsters),
+    Option("Race Variant", option_race_variant),
+    Option("Retarget Variant", option_retarget_variant),
+    Option("Sweep CR Settings", option_sweep_cr_settings)
 ]
 
-# Turn our options list into purty print.
-print('\n'.join(f"{o}. {options[o].name:<20}" for o in range(0, len(options))))
+# Guarded, as create_many's worker processes re-import us on spawn.
+if __name__ == '__main__':
+
+    # Turn our options list into purty print.
+    print('\n'.join(
+        f"{o}. {options[o].name:<20}" for o in range(0, len(options))
+    ))
 
-# Choice
-options[get_count_input("?", 0, len(options))].function()
+    # Choice
+    options[get_count_input("?", 0, len(options))].function()
@@ -4,6 +4,9 @@
 
 """
 
+# Sys
+from copy import copy
+
 # myhn
 from .enumerators import ArmorEnum, ExtrasEnum, StatsEnum
 from .universals import get_actual_from_compound, spaced_list
@@ -36,6 +39,13 @@ class Armor():
 
         return extra in self._data[ArmorEnum.EXTRA]
 
+    def get_compound(self):
+        """
+        Gets the compound Armors.create makes us from
+        """
+
+        return f"{self._name}_{self._ac - self._data[ArmorEnum.AC_BONUS]}"
+
     def get_extra(self, extra):
         """
         Get Extra
@@ -95,6 +105,17 @@ class Armors():
 
         self._armor_list.append(armor)
 
+    def copy_with_stats(self, stats):
+        """
+        Copies us and our armor list onto another stats instance.  Armor
+        itself never changes, so it is shared along with the data table.
+        """
+
+        armors = copy(self)
+        armors._stats = stats
+        armors._armor_list = list(self._armor_list)
+        return armors
+
     def create(self, compound, add=False):
         """
         Create Armor
@@ -117,14 +138,21 @@ class Armors():
         Get AC
         """
 
+        return self.get_ac_from(
+            self._armor_list,
+            self._stats.get_stat_bonus(StatsEnum.DEXTERITY.value)
+        )
+
+    def get_ac_from(self, armor_list, dex_bonus):
+        """
+        Get AC, given a list of Armor and a DEX Bonus
+        """
+
         # AC Defaults to 10 when unarmored
         ac = 10
 
-        # Dex Bonus
-        dex_bonus = self._stats.get_stat_bonus(StatsEnum.DEXTERITY.value)
-
         # Do we have any armor?
-        for armor in self._armor_list:
+        for armor in armor_list:
 
             # Add the ac
             ac = ac + armor._ac
@@ -149,6 +177,16 @@ class Armors():
                 return armor
         return None
 
+    def get_slot(self, slot):
+        """
+        Get the Armor in the given slot, if any
+        """
+
+        for armor in self._armor_list:
+            if slot == armor._data[ArmorEnum.SLOT]:
+                return armor
+        return None
+
     def has_armor(self, armor_to_check):
         """
         Has Armor
@@ -173,10 +211,7 @@ class Armors():
         Has Armor Slot?
         """
 
-        for armor in self._armor_list:
-            if slot == armor._data[ArmorEnum.SLOT]:
-                return True
-        return False
+        return self.get_slot(slot) is not None
 
     def has_slot_by_armor(self, armor):
         """
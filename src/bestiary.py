@@ -0,0 +1,214 @@
+"""
+
+    bestiary.py
+
+    Monster.get_cr works out one monster at a time.  A Bestiary compiles
+    what every monster's CR is worked out from, see
+    Monster.get_cr_features, into a column per feature, so the CRs of the
+    lot and their accumulations come out of a handful of numpy operations.
+
+"""
+
+# Sys
+from collections import Counter
+
+# Optional, but a Bestiary needs it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Meeeaaaine
+from .challengerating import (
+    MONSTER_STATS_BY_CR_ARRAY, clip_cr_row, cr_defense_batch,
+    cr_offense_batch
+)
+from .enumerators import MonsterStatsByCrEnum
+from .monster import CR_INPUTS, CR_SETTINGS_KEYS
+from .settings import CR
+
+
+__all__ = ["Bestiary"]
+
+
+class Bestiary():
+    """
+    CR features of many monsters, a numpy array per feature and a row
+    per monster.  CR settings are weighed by settings.CR as it is when we
+    are asked, so tweaks to it show up without compiling again.
+    """
+
+    def __init__(self, monsters):
+        """
+        Constructor!
+        monsters is a dict of name -> Monster.  Raises an ImportError
+        without numpy.
+        """
+
+        # Need numpy
+        if numpy is None:
+            raise ImportError("A Bestiary needs numpy")
+
+        # Names
+        self.names = list(monsters.keys())
+
+        # Expected CRs
+        self.expected_crs = numpy.array(
+            [monster._expected_cr for monster in monsters.values()],
+            dtype=float
+        )
+
+        # Gather our features, a list per column.
+        inputs = {column: [] for column in CR_INPUTS}
+        counts = {}
+        for row, monster in enumerate(monsters.values()):
+            cr_inputs, cr_counts = monster.get_cr_features()
+            for column in CR_INPUTS:
+                inputs[column].append(cr_inputs[column])
+            for column, count in cr_counts.items():
+                if column not in counts:
+                    counts[column] = [0] * len(self.names)
+                counts[column][row] = count
+
+        # DEFENSE/OFFENSE inputs, by CR_INPUTS
+        self.inputs = {
+            column: numpy.array(values, dtype=float)
+            for column, values in inputs.items()
+        }
+
+        # CR setting counts, by (CR setting, what it's per or None)
+        self.counts = {
+            column: numpy.array(values, dtype=float)
+            for column, values in counts.items()
+        }
+
+    def __len__(self):
+        """
+        How many monsters we hold
+        """
+
+        return len(self.names)
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return f"Monsters: {len(self)} Columns: {len(self.counts)}"
+
+    def get_cr(self):
+        """
+        Calculates every monster's Challenge Rating, as Monster.get_cr.
+        Returns (cr, cr_settings, cr_base) of arrays, a row per monster.
+        """
+
+        # Our DEFENSE/OFFENSE rows, and CR settings
+        cr_base = self.get_cr_base()
+        cr_settings = self.get_cr_settings()
+
+        # Create CR Average, kept on the table as Monster.get_cr does.
+        cr_average = clip_cr_row(numpy.floor(
+            (cr_base["DEFENSE"] + cr_base["OFFENSE"]) / 2 +
+            sum(cr_settings[key] for key in CR_SETTINGS_KEYS)
+        ).astype(int))
+
+        # Return
+        return (
+            MONSTER_STATS_BY_CR_ARRAY[cr_average, MonsterStatsByCrEnum.CR],
+            cr_settings, cr_base
+        )
+
+    def get_cr_accumulation(self):
+        """
+        Total of each CR Score over all monsters, as a Counter.  Scores
+        below zero count as zero, as adding Counters does.
+        """
+
+        # Positive parts only
+        _, cr_settings, cr_base = self.get_cr()
+        cr_total = Counter()
+        for key, values in list(cr_settings.items()) + list(cr_base.items()):
+            cr_total[key] = numpy.maximum(values, 0).sum().item()
+
+        # Drop those that came to nothing.
+        return +cr_total
+
+    def get_cr_base(self):
+        """
+        Every monster's DEFENSE and OFFENSE rows, as arrays.
+        """
+
+        return {
+            "DEFENSE": cr_defense_batch(
+                self.inputs["HP"], self.inputs["AC"]
+            ),
+            "OFFENSE": cr_offense_batch(
+                self.inputs["DAMAGE_PER_ROUND"],
+                self.inputs["ATTACK_BONUS"], self.inputs["SAVE_DC"]
+            )
+        }
+
+    def get_cr_combined(self, row, cr_settings, cr_base):
+        """
+        A single monster's CR Scores as a Counter, given its row and our
+        get_cr, as Counter(cr_settings) + Counter(cr_base) from
+        Monster.get_cr.
+        """
+
+        # Positive scores only
+        return +Counter({
+            key: values[row].item()
+            for key, values in
+            list(cr_settings.items()) + list(cr_base.items())
+        })
+
+    def get_cr_differences(self):
+        """
+        The monsters whose CR isn't their expected CR, as
+        (name, expected cr, cr, CR Scores Counter).
+        """
+
+        cr, cr_settings, cr_base = self.get_cr()
+        return [
+            (
+                self.names[row], self.expected_crs[row].item(),
+                cr[row].item(),
+                self.get_cr_combined(row, cr_settings, cr_base)
+            )
+            for row in numpy.flatnonzero(cr != self.expected_crs)
+        ]
+
+    def get_cr_settings(self):
+        """
+        Every monster's CR settings, by CR_SETTINGS_KEYS, as arrays.
+        Each is the sum of its counts times their settings.CR.
+        """
+
+        # Nothing, until we count it.
+        cr_settings = {
+            key: numpy.zeros(len(self.names)) for key in CR_SETTINGS_KEYS
+        }
+
+        # Weigh our counts
+        for (key, per), counts in self.counts.items():
+            cr_settings[key] = cr_settings[key] + counts * self.get_weight(
+                key, per
+            )
+
+        # Return
+        return cr_settings
+
+    def get_weight(self, key, per):
+        """
+        settings.CR for a count column.  Those it doesn't list weigh
+        nothing.
+        """
+
+        if per is None:
+            return CR[key]
+        return CR[key].get(per, 0)
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
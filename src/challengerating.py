@@ -9,6 +9,15 @@
 
 """
 
+# Sys
+from bisect import bisect_right
+
+# Optional, only the batch functions need it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Moin
 from .enumerators import MonsterStatsByCrEnum
 
@@ -53,6 +62,34 @@ MONSTER_STATS_BY_CR = [
     [30, 		9, 	19,	808,    850,    14, 303,    320,    23]
 ]
 
+# CR -> Row of MONSTER_STATS_BY_CR
+CR_ROWS = {
+    stats[MonsterStatsByCrEnum.CR]: row
+    for row, stats in enumerate(MONSTER_STATS_BY_CR)
+}
+
+# Ranges cr_calculation looks up, by (minimum, maximum) column, compiled
+# into sorted lists of each row's minimum and maximum for bisect.
+CR_BOUNDS = {
+    (minimum, maximum): (
+        [stats[minimum] for stats in MONSTER_STATS_BY_CR],
+        [stats[maximum] for stats in MONSTER_STATS_BY_CR]
+    )
+    for minimum, maximum in [
+        (MonsterStatsByCrEnum.MIN_HP, MonsterStatsByCrEnum.MAX_HP),
+        (
+            MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MIN,
+            MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MAX
+        )
+    ]
+}
+
+# MONSTER_STATS_BY_CR as an array, for the batch functions
+if numpy is not None:
+    MONSTER_STATS_BY_CR_ARRAY = numpy.array(MONSTER_STATS_BY_CR, dtype=float)
+else:
+    MONSTER_STATS_BY_CR_ARRAY = None
+
 # Monster XP By CR
 MONSTER_XP_BY_CR = {
     0		:	10,
@@ -129,6 +166,31 @@ def cr_defense(hp, ac):
         )
 
 
+def cr_defense_batch(hp, ac):
+    """
+    cr_defense over arrays of HP and AC.
+    Returns an array of the Rows our CRs are on.
+    """
+
+    return cr_calculation_batch(
+        hp, MonsterStatsByCrEnum.MIN_HP,
+        MonsterStatsByCrEnum.MAX_HP, ac, MonsterStatsByCrEnum.AC
+        )
+
+
+def clip_cr_row(row):
+    """
+    Keeps a CR row on the table, rows below the first land on it and
+    rows past the last on the last.  Takes an int, or a numpy array of
+    them.
+    """
+
+    last_row = len(MONSTER_STATS_BY_CR) - 1
+    if numpy is not None and isinstance(row, numpy.ndarray):
+        return numpy.clip(row, 0, last_row)
+    return min(max(row, 0), last_row)
+
+
 def cr_offense(damage_per_round, attack_bonus, save_dc):
     """
     Calculates our offense CR, given damage per round, attack bonus and save dc
@@ -152,6 +214,28 @@ def cr_offense(damage_per_round, attack_bonus, save_dc):
     return max(attack_bonus_cr, save_dc_cr)
 
 
+def cr_offense_batch(damage_per_round, attack_bonus, save_dc):
+    """
+    cr_offense over arrays of damage per round, attack bonus and save dc.
+    Returns an array of the Rows our CRs are on.
+    """
+
+    # The greater of attack bonus vs save dc, as cr_offense.
+    attack_bonus_cr = cr_calculation_batch(
+        damage_per_round, MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MIN,
+        MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MAX, attack_bonus,
+        MonsterStatsByCrEnum.ATTACK_BONUS
+        )
+    save_dc_cr = cr_calculation_batch(
+        damage_per_round, MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MIN,
+        MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MAX, save_dc,
+        MonsterStatsByCrEnum.SAVE_DC
+        )
+
+    # Return the highest.
+    return numpy.maximum(attack_bonus_cr, save_dc_cr)
+
+
 def cr_calculation(
     comparison_value, comparison_maximum_index,
     comparison_minimum_index, comparison_difference_value,
@@ -159,39 +243,83 @@ def cr_calculation(
 ):
     """
     Calculates CR.  Used for Offense or Defense.
+    comparison_maximum_index is the column of each row's lowest value,
+    comparison_minimum_index its highest.  Values between two rows land
+    on row 0, values above the last row on the last row.
     """
 
-    # CR Row
-    cr_row = 0
+    # Bounds, compiled at import
+    minimums, maximums = CR_BOUNDS[
+        (comparison_maximum_index, comparison_minimum_index)
+    ]
 
-    # Iterate, seeing which CR Row we are on.
-    for i in range(0, len(MONSTER_STATS_BY_CR)):
+    # Last row starting at or below our value
+    cr_row = bisect_right(minimums, comparison_value) - 1
 
-        compare_max = MONSTER_STATS_BY_CR[i][comparison_maximum_index]
-        compare_min = MONSTER_STATS_BY_CR[i][comparison_minimum_index]
+    # Below the first row, or between two?  Row 0.
+    if cr_row < 0 or (
+        comparison_value > maximums[cr_row] and
+        cr_row < len(MONSTER_STATS_BY_CR) - 1
+    ):
+        return 0
 
-        # We in this range?
-        if comparison_value >= compare_max and comparison_value <= compare_min:
+    # Difference
+    comparison = MONSTER_STATS_BY_CR[cr_row][comparison_difference_index]
+    difference = comparison_difference_value - comparison
 
-            # Store the row.
-            cr_row = i
+    # CR Difference
+    cr_row = cr_row + int(difference / 2)
 
-            # Difference
-            comparison = MONSTER_STATS_BY_CR[i][comparison_difference_index]
-            difference = comparison_difference_value - comparison
+    # Make sure our cr_row is valid
+    return min(max(cr_row, 0), len(MONSTER_STATS_BY_CR) - 1)
 
-            # CR Difference
-            cr_row = cr_row + int(difference / 2)
 
-            # We done
-            break
+def cr_calculation_batch(
+    comparison_values, comparison_maximum_index,
+    comparison_minimum_index, comparison_difference_values,
+    comparison_difference_index
+):
+    """
+    cr_calculation over arrays of values, one searchsorted for all of
+    them.  Raises an ImportError without numpy.
+    """
 
-    # Make sure our cr_row is valid
-    if cr_row < 0:
-        cr_row = 0
+    # Need numpy
+    if numpy is None:
+        raise ImportError("The batch CR functions need numpy")
+
+    # Vars
+    comparison_values = numpy.asarray(comparison_values, dtype=float)
+    comparison_difference_values = numpy.asarray(
+        comparison_difference_values, dtype=float
+    )
+    last_row = len(MONSTER_STATS_BY_CR) - 1
+
+    # Bounds, compiled at import
+    minimums = MONSTER_STATS_BY_CR_ARRAY[:, comparison_maximum_index]
+    maximums = MONSTER_STATS_BY_CR_ARRAY[:, comparison_minimum_index]
+
+    # Last row starting at or below each value
+    cr_rows = numpy.searchsorted(minimums, comparison_values, side="right") - 1
+
+    # Below the first row, or between two, land on row 0.
+    found = cr_rows >= 0
+    cr_rows = numpy.clip(cr_rows, 0, last_row)
+    found &= (
+        (comparison_values <= maximums[cr_rows]) | (cr_rows == last_row)
+    )
+
+    # Difference, rounded towards zero as int() does.
+    comparisons = MONSTER_STATS_BY_CR_ARRAY[
+        cr_rows, comparison_difference_index
+    ]
+    differences = comparison_difference_values - comparisons
+
+    # CR Difference
+    cr_rows = cr_rows + numpy.trunc(differences / 2).astype(int)
 
-    # Return
-    return cr_row
+    # Make sure our cr_rows are valid
+    return numpy.where(found, numpy.clip(cr_rows, 0, last_row), 0)
 
 
 def get_cr_from_row(row):
@@ -204,12 +332,10 @@ def get_cr_from_row(row):
 
 def get_cr_row(cr):
     """
-    Gets our CR Row, given a CR number.
+    Gets our CR Row, given a CR number.  None if it isn't a CR.
     """
 
-    for i in range(0, len(MONSTER_STATS_BY_CR)):
-        if MONSTER_STATS_BY_CR[i][MonsterStatsByCrEnum.CR] == cr:
-            return i
+    return CR_ROWS.get(cr)
 
 
 def get_monster_stats_from_cr(cr):
@@ -217,7 +343,7 @@ def get_monster_stats_from_cr(cr):
     Gets our Monster Stats, given a CR
     """
 
-    return MONSTER_STATS_BY_CR[get_cr_row(cr)]
+    return MONSTER_STATS_BY_CR[CR_ROWS[cr]]
 
 
 def get_xp_by_cr(cr):
@@ -0,0 +1,121 @@
+"""
+
+    crcache.py
+
+    Variant searches keep landing on the same stats and equipment, so we
+    remember the CR of each state we've seen by its fingerprint.
+
+"""
+
+# Sys
+from collections import OrderedDict
+
+
+__all__ = ["CRCache"]
+
+
+class CRCache():
+    """
+    Least Recently Used cache of Monster CRs, keyed by
+    Monster.get_cr_fingerprint
+    """
+
+    # Default number of CRs we hold on to
+    MAXIMUM_SIZE = 4096
+
+    def __init__(self, maximum_size=MAXIMUM_SIZE):
+        """
+        Constructor!
+        """
+
+        # Vars
+        self._cache = OrderedDict()
+        self._maximum_size = maximum_size
+
+        # Counters, for sizing
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """
+        How many CRs we hold
+        """
+
+        return len(self._cache)
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return (
+            f"Size: {len(self)}/{self._maximum_size} Hits: {self.hits} "
+            f"Misses: {self.misses} Hit Ratio: {self.get_hit_ratio():.2f}"
+        )
+
+    def add(self, fingerprint, cr):
+        """
+        Remembers the CR of a fingerprint we worked out ourselves.
+        """
+
+        self._cache[fingerprint] = cr
+        self._cache.move_to_end(fingerprint)
+
+        # Too big?  Drop the least recently used.
+        if len(self._cache) > self._maximum_size:
+            self._cache.popitem(last=False)
+
+    def clear(self):
+        """
+        Empties the cache, needed if settings.CR is changed.
+        """
+
+        self._cache.clear()
+
+    def get(self, fingerprint):
+        """
+        The CR we remember for fingerprint, None if we haven't seen it.
+        """
+
+        # Seen it?
+        if fingerprint in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(fingerprint)
+            return self._cache[fingerprint]
+
+        # Nope
+        self.misses += 1
+        return None
+
+    def get_cr(self, monster):
+        """
+        Gets monster's CR, (cr, cr_settings, cr_base) as Monster.get_cr
+        returns it, from the cache if we've seen its state before.
+        """
+
+        # Seen it?
+        fingerprint = monster.get_cr_fingerprint()
+        cr = self.get(fingerprint)
+
+        # Nope, work it out and remember it.
+        if cr is None:
+            cr = monster.get_cr()
+            self.add(fingerprint, cr)
+
+        # Return
+        return cr
+
+    def get_hit_ratio(self):
+        """
+        Hits over lookups, 0 when we haven't been used.
+        """
+
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0
+        return self.hits / lookups
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,336 @@
+"""
+
+    crfitter.py
+
+    settings.CR is tuned by hand until monsters land on their expected CR.
+    A CRFitter looks for the settings.CR that put the most of a Bestiary
+    on their expected CR.  Each monster's counts are compiled once, so
+    trying a set of settings is a matrix product, not a rebuild of every
+    Monster.
+
+"""
+
+# Sys
+from copy import deepcopy
+
+# Optional, but a CRFitter needs it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Meeeaaaine
+from .challengerating import MONSTER_STATS_BY_CR, clip_cr_row, get_cr_row
+from .settings import CR
+
+
+__all__ = ["CRFit", "CRFitter", "get_knob_name"]
+
+
+class CRFit():
+    """
+    A set of settings.CR coefficients, and how the bestiary does with it
+    """
+
+    def __init__(self, coefficients, original, residuals):
+        """
+        Constructor!
+        """
+
+        # Coefficients, and what they were, by (CR setting, per or None).
+        self.coefficients = coefficients
+        self.original = original
+
+        # Name -> CR row we land on, less our expected row
+        self.residuals = residuals
+        self.mismatches = sum(
+            1 for residual in residuals.values() if residual
+        )
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        lines = [f"Mismatches: {self.mismatches}/{len(self.residuals)}"]
+        for knob, coefficient in self.coefficients.items():
+            lines.append(
+                f"{get_knob_name(knob)}: {self.original[knob]:g} -> "
+                f"{coefficient:g}"
+            )
+        return "\n".join(lines)
+
+    def get_settings(self):
+        """
+        A copy of settings.CR, with our coefficients.
+        """
+
+        settings = deepcopy(CR)
+        for (key, per), coefficient in self.coefficients.items():
+            if per is None:
+                settings[key] = coefficient
+            else:
+                settings[key][per] = coefficient
+        return settings
+
+
+class CRFitter():
+    """
+    Fits the settings.CR coefficients a Bestiary counts, see
+    Bestiary.counts, to its expected CRs.  A least squares fit to the
+    middle of each expected row, and settings.CR as it is, are each
+    refined by coordinate search over mismatched monsters, and the best
+    of the two wins.  There are far fewer monsters than ways to fit
+    them, so we look for the smallest change to settings.CR that does;
+    coefficients no monster counts stay as they are, the rest are pulled
+    toward what they are, and none changes sign.
+    """
+
+    # Coordinate search, steps each way from a coefficient we try at once,
+    # the step we start at, and the step we stop halving at.
+    COORDINATE_STEPS = 10
+    COORDINATE_STEP = 0.05
+    MINIMUM_STEP = 0.005
+
+    # How hard least squares pulls each coefficient toward settings.CR
+    RIDGE = 1.0
+
+    def __init__(self, bestiary):
+        """
+        Constructor!
+        Raises an ImportError without numpy.
+        """
+
+        # Need numpy
+        if numpy is None:
+            raise ImportError("A CRFitter needs numpy")
+
+        # Names, and the coefficients we fit
+        self._names = bestiary.names
+        self._columns = list(bestiary.counts.keys())
+
+        # Counts, a row per monster and a column per coefficient
+        self._counts = numpy.zeros((len(bestiary), len(self._columns)))
+        for column, key in enumerate(self._columns):
+            self._counts[:, column] = bestiary.counts[key]
+
+        # Columns some monster counts, the only ones we fit
+        self._used = numpy.flatnonzero(numpy.abs(self._counts).sum(axis=0))
+
+        # DEFENSE/OFFENSE average, which settings.CR doesn't touch
+        cr_base = bestiary.get_cr_base()
+        self._base = (cr_base["DEFENSE"] + cr_base["OFFENSE"]) / 2
+
+        # The rows we want to land on
+        self._expected_rows = numpy.array(
+            [get_cr_row(cr) for cr in bestiary.expected_crs.tolist()]
+        )
+
+        # Misses outweigh every row of distance put together.
+        self._miss_weight = len(MONSTER_STATS_BY_CR) * len(bestiary) + 1
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return (
+            f"Monsters: {len(self._names)} Coefficients: {len(self._columns)}"
+        )
+
+    def evaluate(self, coefficients):
+        """
+        How many monsters miss their expected CR with coefficients, an
+        array by our columns.
+        """
+
+        rows = self.get_rows(self._base + self._counts @ coefficients)
+        return int((rows != self._expected_rows).sum())
+
+    def fit(self):
+        """
+        Fits our coefficients, returning the best as a CRFit.
+        """
+
+        # Where we start from
+        original = self.get_coefficients()
+        starts = [original, self.get_least_squares()]
+
+        # Refine each, keeping the best.
+        fits = [self.get_coordinate_search(start) for start in starts]
+        coefficients, _ = min(fits, key=lambda fit: fit[1])
+
+        # Residuals, by name
+        rows = self.get_rows(self._base + self._counts @ coefficients)
+        residuals = dict(zip(
+            self._names, (rows - self._expected_rows).tolist()
+        ))
+
+        # Return
+        return CRFit(
+            dict(zip(self._columns, coefficients.tolist())),
+            dict(zip(self._columns, original.tolist())), residuals
+        )
+
+    def get_coefficients(self):
+        """
+        settings.CR as it is, as an array by our columns
+        """
+
+        return numpy.array([
+            CR[key] if per is None else CR[key].get(per, 0)
+            for key, per in self._columns
+        ], dtype=float)
+
+    def get_coordinate_search(self, coefficients):
+        """
+        Steps one coefficient at a time to whichever of its
+        COORDINATE_STEPS each way scores best, the smallest if several
+        do, halving the step when none help.  Only columns a monster
+        counts move, and never past zero from settings.CR's sign.
+        Returns the coefficients and their score.
+        """
+
+        # Vars
+        original = self.get_coefficients()
+        coefficients = coefficients.copy()
+        sums = self._base + self._counts @ coefficients
+        score = self.get_scores(sums[:, None])[0]
+        step = self.COORDINATE_STEP
+
+        # Until our steps are too small to matter
+        while step >= self.MINIMUM_STEP:
+
+            improved = False
+            deltas = numpy.arange(
+                -self.COORDINATE_STEPS, self.COORDINATE_STEPS + 1
+            ) * step
+
+            # Every step of every coefficient, all monsters at once.
+            for column in self._used:
+                counts = self._counts[:, column]
+                scores = self.get_scores(
+                    sums[:, None] + counts[:, None] * deltas[None, :]
+                ).astype(float)
+
+                # No changing sign
+                scores[
+                    original[column] * (coefficients[column] + deltas) < 0
+                ] = numpy.inf
+
+                # Better?  The smallest step of the best.
+                candidates = numpy.flatnonzero(scores == scores.min())
+                best = int(
+                    candidates[numpy.abs(deltas[candidates]).argmin()]
+                )
+                if scores[best] < score:
+                    coefficients[column] += deltas[best]
+                    sums = sums + counts * deltas[best]
+                    score = scores[best]
+                    improved = True
+
+            # Nothing helped?  Look closer.
+            if not improved:
+                step /= 2
+
+        # Return
+        return coefficients, score
+
+    def get_least_squares(self):
+        """
+        Coefficients that land each monster closest to the middle of its
+        expected row, by least squares, each pulled toward settings.CR by
+        RIDGE.  Columns no monster counts stay as they are, and any that
+        would change sign stop at zero.
+        """
+
+        # What's left to make up, from settings.CR as it is
+        original = self.get_coefficients()
+        targets = (
+            self._expected_rows + 0.5 - self._base - self._counts @ original
+        )
+
+        # Changes to the columns we count, each also asked to be zero.
+        used = len(self._used)
+        changes, _, _, _ = numpy.linalg.lstsq(
+            numpy.vstack([
+                self._counts[:, self._used], self.RIDGE * numpy.eye(used)
+            ]),
+            numpy.concatenate([targets, numpy.zeros(used)]), rcond=None
+        )
+
+        # Apply them, keeping signs.
+        coefficients = original.copy()
+        coefficients[self._used] += changes
+        coefficients[original * coefficients < 0] = 0
+        return coefficients
+
+    def get_sensitivity(self, knob, values, coefficients=None):
+        """
+        Sweeps knob, a (CR setting, per or None), over values with every
+        other coefficient as in coefficients, or settings.CR.  Returns,
+        for each value, (value, monsters whose CR changes, mean rows off
+        expected).
+        """
+
+        # Our counts for knob, none if no monster has any.
+        values = numpy.asarray(values, dtype=float)
+        if coefficients is None:
+            coefficients = self.get_coefficients()
+        if knob in self._columns:
+            column = self._columns.index(knob)
+            counts = self._counts[:, column]
+            deltas = values - coefficients[column]
+        else:
+            counts = numpy.zeros(len(self._names))
+            deltas = numpy.zeros(len(values))
+
+        # Every value, all monsters at once.
+        sums = self._base + self._counts @ coefficients
+        rows = self.get_rows(sums[:, None] + counts[:, None] * deltas[None, :])
+        changed = (rows != self.get_rows(sums)[:, None]).sum(axis=0)
+        if len(self._names):
+            errors = numpy.abs(
+                rows - self._expected_rows[:, None]
+            ).mean(axis=0)
+        else:
+            errors = numpy.zeros(len(values))
+
+        # Return
+        return list(zip(values.tolist(), changed.tolist(), errors.tolist()))
+
+    def get_rows(self, sums):
+        """
+        CR rows sums land on, as Monster.get_cr floors them, kept on the
+        table
+        """
+
+        return clip_cr_row(numpy.floor(sums).astype(int))
+
+    def get_scores(self, sums):
+        """
+        Scores of a column of sums per candidate; misses, then how many
+        rows off we are in total.  Lower is better.
+        """
+
+        distances = numpy.abs(
+            self.get_rows(sums) - self._expected_rows[:, None]
+        )
+        return (
+            (distances > 0).sum(axis=0) * self._miss_weight +
+            distances.sum(axis=0)
+        )
+
+
+def get_knob_name(knob):
+    """
+    Name of a (CR setting, per or None) coefficient, for printing
+    """
+
+    key, per = knob
+    return key if per is None else f"{key} {per.name}"
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
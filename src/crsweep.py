@@ -0,0 +1,160 @@
+"""
+
+    crsweep.py
+
+    Before changing a settings.CR coefficient, we want to know what it
+    does to the bestiary.  A CRSweep sweeps each coefficient, or knob,
+    over a range of values across a process pool, reusing one CRFitter's
+    compiled counts, and reports how many monsters change CR and how far
+    off their expected CR they land.
+
+"""
+
+# Sys
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import os
+
+# Optional, but a CRSweep needs it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Meeeaaaine
+from .crfitter import CRFitter, get_knob_name
+
+
+__all__ = ["CRSweep"]
+
+
+# Per process data for a CRSweep, set by _sweep_init
+_SWEEP = {}
+
+
+class CRSweep():
+    """
+    How a bestiary's CRs move as each knob, a (CR setting, per or None),
+    is swept over its values and every other stays as settings.CR has it.
+    Knobs are spread across workers; each sweeps all its values at once.
+    """
+
+    # Values we sweep each knob over, when not given any
+    POINTS = 11
+
+    def __init__(self, bestiary, grid=None, workers=None):
+        """
+        Constructor!
+        grid is a dict of knob -> values, by default every knob the
+        bestiary counts from 0 to twice what it is now.  Raises an
+        ImportError without numpy.
+        """
+
+        # Need numpy
+        if numpy is None:
+            raise ImportError("A CRSweep needs numpy")
+
+        # Compiled once, for every worker.
+        fitter = CRFitter(bestiary)
+        coefficients = fitter.get_coefficients()
+
+        # Our grid
+        if grid is None:
+            grid = self.get_grid(bestiary, coefficients)
+
+        # Single worker?  No need for a pool.
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1:
+            _sweep_init(fitter, coefficients)
+            sweeps = [
+                _sweep_task(knob, values) for knob, values in grid.items()
+            ]
+
+        # Otherwise, a knob per task.
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_sweep_init,
+                initargs=(fitter, coefficients)
+            ) as executor:
+                sweeps = list(executor.map(
+                    _sweep_task, grid.keys(),
+                    [list(values) for values in grid.values()]
+                ))
+
+        # (knob, value, monsters changed, mean rows off expected), in grid
+        # order.
+        self.rows = [
+            (knob, value, changed, error)
+            for knob, sweep in zip(grid.keys(), sweeps)
+            for value, changed, error in sweep
+        ]
+
+    def __iter__(self):
+        """
+        Our rows
+        """
+
+        return iter(self.rows)
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return "\n".join(
+            f"{get_knob_name(knob)} {value:g}: Changed: {changed} "
+            f"Error: {error:.3f}"
+            for knob, value, changed, error in self.rows
+        )
+
+    def get_grid(self, bestiary, coefficients):
+        """
+        Every knob bestiary counts, each swept over POINTS values from 0
+        to twice what it is now, or to 1 if it's 0.
+        """
+
+        grid = {}
+        for knob, coefficient in zip(bestiary.counts.keys(), coefficients):
+            maximum = 2 * coefficient if coefficient else 1
+            grid[knob] = numpy.linspace(0, maximum, self.POINTS).tolist()
+        return grid
+
+    def save(self, path):
+        """
+        Saves our rows to path, as CSV.
+        """
+
+        with open(path, "w", newline="") as report_file:
+            writer = csv.writer(report_file)
+            writer.writerow(
+                ["knob", "value", "monsters_changed", "mean_abs_row_error"]
+            )
+            for knob, value, changed, error in self.rows:
+                writer.writerow([
+                    get_knob_name(knob), f"{value:g}", changed, f"{error:.4f}"
+                ])
+
+
+def _sweep_init(fitter, coefficients):
+    """
+    Sets up a CRSweep worker process.
+    """
+
+    _SWEEP["fitter"] = fitter
+    _SWEEP["coefficients"] = coefficients
+
+
+def _sweep_task(knob, values):
+    """
+    Sweeps a single knob in a CRSweep worker process.
+    """
+
+    return _SWEEP["fitter"].get_sensitivity(
+        knob, values, _SWEEP["coefficients"]
+    )
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
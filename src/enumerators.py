@@ -302,6 +302,17 @@ class TraitsEnum(IntEnum):
     EXTRA = 3
 
 
+class VariantSearchEnum(Enum):
+    """
+    How a MonsterVariant searches for a matching CR
+    """
+
+    RANDOM = 0  # Blind random restarts, every iteration re-rolls everything
+    GUIDED = 1  # Hill-climbs using the DEFENSE/OFFENSE rows of get_cr
+    EXHAUSTIVE = 2  # Picks from the matches we enumerate, see variantspace
+    GENETIC = 3  # Breeds a population, scoring a generation at a time
+
+
 class WeaponsEnum(IntEnum):
     """
     Weapons Enum
@@ -0,0 +1,126 @@
+"""
+
+    levercurves.py
+
+    HP only goes up with hit dice, and weapon DPR with attacks per round.
+    Worked out once per monster, the hit dice and attacks for any CR row
+    are a bisect away, no CR calculations needed.  How far the levers go
+    is worked out from the top of the CR table, see get_lever_maximums.
+
+"""
+
+# Sys
+from bisect import bisect_left
+import math
+
+# Meeeaaaine
+from .challengerating import MONSTER_STATS_BY_CR
+from .enumerators import MonsterStatsByCrEnum
+from .variantbounds import get_bonus_range
+
+
+__all__ = ["LeverCurves", "get_lever_maximums"]
+
+
+class LeverCurves():
+    """
+    HP for every hit dice count, and weapon DPR for every attacks per
+    round, of a monster's base stats and equipment.
+    """
+
+    def __init__(self, monster, maximum_hit_dice, maximum_attacks_per_round):
+        """
+        Constructor!
+        """
+
+        # A copy to pull levers on
+        monster = monster.get_variant_copy()
+
+        # Attacks we fall back on when weapons do no damage
+        self._attacks_per_round = monster._attacks_per_round
+
+        # HP, by hit dice count
+        self._hp_curve = []
+        for hit_dice_count in range(1, maximum_hit_dice + 1):
+            monster.set_hit_dice_count(hit_dice_count)
+            self._hp_curve.append(monster.get_hp_average())
+
+        # DPR, by attacks per round
+        damage_per_round = monster._weapons.get_dpr_max()
+        self._dpr_curve = [
+            damage_per_round * attacks_per_round
+            for attacks_per_round in range(1, maximum_attacks_per_round + 1)
+        ]
+
+    def get_attacks_per_round(self, row):
+        """
+        Fewest attacks per round whose DPR reaches row's, or our most.
+        Weapons that do no damage keep our own.
+        """
+
+        # Attacks don't help?
+        if not self._dpr_curve[-1]:
+            return self._attacks_per_round
+
+        # Fewest that get there
+        minimum = MONSTER_STATS_BY_CR[row][
+            MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MIN
+        ]
+        return self.get_lever(self._dpr_curve, minimum)
+
+    def get_hit_dice_count(self, row):
+        """
+        Fewest hit dice whose HP reaches row's, or our most.
+        """
+
+        minimum = MONSTER_STATS_BY_CR[row][MonsterStatsByCrEnum.MIN_HP]
+        return self.get_lever(self._hp_curve, minimum)
+
+    def get_lever(self, curve, minimum):
+        """
+        Fewest of a lever, counting from one, whose curve reaches minimum.
+        """
+
+        return min(bisect_left(curve, minimum), len(curve) - 1) + 1
+
+
+def get_lever_maximums(monster, maximum_hit_dice, maximum_attacks_per_round):
+    """
+    Most hit dice and attacks per round a variant of monster could need
+    to reach the top of the CR table, never fewer than the maximums we
+    are given.  HP per hit die is counted at our lowest CON bonus, and
+    DPR per attack with our own weapons.  Weapons that do no damage
+    leave attacks at maximum_attacks_per_round.
+    """
+
+    # Top of the table
+    top = MONSTER_STATS_BY_CR[-1]
+
+    # Hit dice, a die's average with the least CON we could have
+    hit_die = max(
+        1, (monster._hit_dice_size + 1) / 2 + min(get_bonus_range(monster))
+    )
+    hit_dice = max(
+        maximum_hit_dice,
+        math.ceil(top[MonsterStatsByCrEnum.MAX_HP] / hit_die)
+    )
+
+    # Attacks, if they help.
+    damage_per_round = monster._weapons.get_dpr_max()
+    attacks_per_round = maximum_attacks_per_round
+    if damage_per_round > 0:
+        attacks_per_round = max(
+            maximum_attacks_per_round,
+            math.ceil(
+                top[MonsterStatsByCrEnum.DAMAGE_PER_ROUND_MAX] /
+                damage_per_round
+            )
+        )
+
+    # Return
+    return hit_dice, attacks_per_round
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
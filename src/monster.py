@@ -7,13 +7,14 @@
 """
 
 # Sys
+from collections import Counter
+from copy import copy, deepcopy
 import math
-import statistics
 
 # Emperts
 from .armors import Armors
 from .challengerating import (
-    cr_defense, cr_offense, get_cr_from_row,
+    clip_cr_row, cr_defense, cr_offense, get_cr_from_row,
     get_monster_stats_from_cr, get_xp_by_cr
 )
 from .TbTBalancedStats.src.balancedstats import BalancedStats
@@ -23,17 +24,30 @@ from .settings import *
 from .spells import Spells
 from .universals import (
     get_json_data, number_signed, range_dict_from_list,
-    spaced_list, number_ord
+    seeded_random, spaced_list, number_ord
 )
 from .weapons import Weapons
 
 
-__all__ = ["Monster", "MonsterWrapper"]
+__all__ = ["CR_INPUTS", "CR_SETTINGS_KEYS", "Monster", "MonsterWrapper"]
 
 
 # ARMOR
 ARMOR = get_json_data("armor")
 
+# CR Settings, in the order get_cr sums and returns them
+CR_SETTINGS_KEYS = [
+    "CONDITION_IMMUNITIES", "DAMAGE_IMMUNITIES", "DAMAGE_RESISTANCES",
+    "DAMAGE_VULNERABILITIES", "INNATECASTING", "MOVEMENT", "RECHARGE",
+    "SAVING_THROWS", "SENSES", "SPELLCASTING", "TRAITS"
+]
+
+# DEFENSE/OFFENSE inputs, see Monster.get_cr_features
+CR_INPUTS = ["HP", "AC", "DAMAGE_PER_ROUND", "ATTACK_BONUS", "SAVE_DC"]
+
+# CR Components that make up our CR Plan, see Monster.get_cr_plan
+CR_PLAN_COMPONENTS = ["CASTING", "STATIC", "TRAITS"]
+
 # Dashes
 DASHES = "-" * 50
 
@@ -162,6 +176,12 @@ class Monster:
         Constructor!
         """
 
+        # Cached CR components, see get_cr
+        self._cr_cache = {}
+
+        # Eligible equipment, see get_eligible_armor/get_eligible_weapons
+        self._eligible_cache = {}
+
         self._name = name
         self._size = size
         self._race = race
@@ -179,7 +199,8 @@ class Monster:
         self._damage_immunities_list = damage_immunities_list
         self._condition_immunities_list = condition_immunities_list
 
-        # Set our Stats
+        # Set our Stats, keeping what we started with
+        self._base_stat_list = list(stat_list)
         self._stats = BalancedStats(stats=stat_list, extra_points=0) #, maximum_stat=30)
 
         # Lists and Dicts Initializers
@@ -257,28 +278,13 @@ class Monster:
         # Create the armor
         armor = self._armors.create(compound)
 
-        # Don't already have this armor?
-        if self._armors.has_armor(armor):
-            return False
-
-        # Can we even use it?
-        if not self.can_has_property(armor.get_monster_properties()):
-            return False
-
-        # Need to make sure we don't already have this slot taken up.
-        if self._armors.has_slot_by_armor(armor):
-            return False
-
-        # Now.  Does this armor have a STR requirement?
-        if (
-            armor.has_extra(ExtrasEnum.STRENGTH_REQUIREMENT) and
-            armor.get_extra(ExtrasEnum.STRENGTH_REQUIREMENT) >
-            self._stats.get_stat(StatsEnum.STRENGTH)
-        ):
+        # Can we add it?
+        if not self.can_add_armor(armor):
             return False
 
         # Add it!
         self._armors.add(armor)
+        self.invalidate_cr("DEFENSE")
 
     def add_language(self, language):
         """
@@ -303,6 +309,7 @@ class Monster:
 
         if movement_name not in self._movement_dict:
             self._movement_dict[movement_name] = movement_value
+            self.invalidate_cr("STATIC")
 
     def add_saving_throw(self, saving_throw):
         """
@@ -311,6 +318,7 @@ class Monster:
 
         if saving_throw not in self._saving_throws_list:
             self._saving_throws_list.append(saving_throw)
+            self.invalidate_cr("STATIC")
 
     def add_sense(self, sense_name, sense_value):
         """
@@ -319,6 +327,7 @@ class Monster:
 
         if sense_name not in self._senses_dict:
             self._senses_dict[sense_name] = sense_value
+            self.invalidate_cr("STATIC")
 
     def add_skill(self, skill_name, skill_value):
         """
@@ -336,6 +345,7 @@ class Monster:
         # Can we use this spell?
         if self.can_has_property(SPELLS[spell][SpellsEnum.MONSTER_PROPERTIES]):
             instance.add(spell, spell_level)
+            self.invalidate_cr("CASTING", "OFFENSE")
 
     def add_trait(self, trait):
         """
@@ -359,6 +369,7 @@ class Monster:
         # Add
         self._traits_list.append(trait)
         self._traits_list.sort()
+        self.invalidate_cr("TRAITS")
 
     def add_weapon(self, compound):
         """
@@ -368,12 +379,49 @@ class Monster:
         # Weapon
         weapon = self._weapons.create(compound)
 
-        # This a NO_ADD?
-        if weapon.has_action_property(ActionPropertiesEnum.NO_ADD):
+        # Can we add it?
+        if not self.can_add_weapon(weapon):
+            return False
+
+        # Add!
+        self._weapons.add(weapon)
+        self.invalidate_cr("OFFENSE")
+
+    def can_add_armor(self, armor):
+        """
+        Can we put on this armor, given what we're already wearing?
+        """
+
+        # Don't already have this armor?
+        if self._armors.has_armor(armor):
+            return False
+
+        # Can we even use it?
+        if not self.can_equip_armor(armor):
+            return False
+
+        # Need to make sure we don't already have this slot taken up.
+        if self._armors.has_slot_by_armor(armor):
+            return False
+
+        # Now.  Does this armor have a STR requirement?
+        if (
+            armor.has_extra(ExtrasEnum.STRENGTH_REQUIREMENT) and
+            armor.get_extra(ExtrasEnum.STRENGTH_REQUIREMENT) >
+            self._stats.get_stat(StatsEnum.STRENGTH)
+        ):
             return False
 
+        # Yup!
+        return True
+
+    def can_add_weapon(self, weapon):
+        """
+        Can we take this weapon, given what we're already holding?
+        """
+
         # Can equip?
-        if not self.can_has_property(weapon.get_monster_properties()):
+        if not self.can_equip_weapon(weapon):
             return False
 
         # Only allow three weapons?
@@ -395,8 +443,29 @@ class Monster:
         ):
             return False
 
-        # Add!
-        self._weapons.add(weapon)
+        # Yup!
+        return True
+
+    def can_equip_armor(self, armor):
+        """
+        Could we ever wear this armor?  Monster properties only, see
+        can_add_armor for what we're wearing.
+        """
+
+        return self.can_has_property(armor.get_monster_properties())
+
+    def can_equip_weapon(self, weapon):
+        """
+        Could we ever hold this weapon?  NO_ADD and monster properties
+        only, see can_add_weapon for what we're holding.
+        """
+
+        # This a NO_ADD?
+        if weapon.has_action_property(ActionPropertiesEnum.NO_ADD):
+            return False
+
+        # Can equip?
+        return self.can_has_property(weapon.get_monster_properties())
 
     def can_has_property(self, monster_properties):
         """
@@ -426,56 +495,62 @@ class Monster:
     def get_cr(self):
         """
         Calculates Challenge Rating
+        Each part is cached until something it reads changes, see
+        invalidate_cr.  The returned dicts are shared with our cache,
+        don't change them.
         """
 
-        # Set up cr settings values, those we tweak.
-        cr_settings = {}
-        cr_settings["CONDITION_IMMUNITIES"] = 0
-        cr_settings["DAMAGE_IMMUNITIES"] = 0
-        cr_settings["DAMAGE_RESISTANCES"] = 0
-        cr_settings["DAMAGE_VULNERABILITIES"] = 0
-        cr_settings["INNATECASTING"] = 0
-        cr_settings["MOVEMENT"] = 0
-        cr_settings["RECHARGE"] = 0
-        cr_settings["SAVING_THROWS"] = 0
-        cr_settings["SENSES"] = 0
-        cr_settings["SPELLCASTING"] = 0
-        cr_settings["TRAITS"] = 0
-
-        # We take these seperate because we need to average them and
-        # not include them in the total.
-        cr_base = {}
-        cr_base["DEFENSE"] = self.get_cr_defense()
-        cr_base["OFFENSE"] = self.get_cr_offense()
+        # Nothing changed since last time?
+        if "CR" not in self._cr_cache:
 
-        # Check Traits
-        # If they have a CR_MODIFIER, add it.
-        for trait in self._traits_list:
+            # We take these seperate because we need to average them and
+            # not include them in the total.
+            cr_base = {}
+            cr_base["DEFENSE"] = self.get_cr_cached(
+                "DEFENSE", self.get_cr_defense
+            )
+            cr_base["OFFENSE"] = self.get_cr_cached(
+                "OFFENSE", self.get_cr_offense
+            )
 
-            # CR Modifier
-            cr_settings["TRAITS"] += (
-                self.get_extra_trait(ExtrasEnum.CR_MODIFIER) * CR["TRAITS"]
+            # Everything else is summed once, in our plan.
+            cr_settings, cr_settings_sum = self.get_cr_cached(
+                "PLAN", self.get_cr_plan
             )
 
-            # Recharge?
-            cr_settings["RECHARGE"] += (
-                self.get_recharge_die_calculation() *
-                CR["RECHARGE"]
+            # Create CR Average, kept on the table so low rows don't wrap.
+            cr_average = clip_cr_row(int(math.floor(
+                (cr_base["DEFENSE"] + cr_base["OFFENSE"]) / 2 +
+                cr_settings_sum
+            )))
+
+            # Store
+            self._cr_cache["CR"] = (
+                get_cr_from_row(cr_average), cr_settings, cr_base
             )
 
-        # Movements
-        for movement in self._movement_dict.keys():
+        # Return
+        return self._cr_cache["CR"]
 
-            # This a value we check against?
-            if movement in CR["MOVEMENT"].keys():
+    def get_cr_cached(self, component, function):
+        """
+        Gets a cached CR component, calculating it with function if
+        it isn't cached.
+        """
 
-                # Divide!
-                thirty_feet_count = self._movement_dict[movement] / 30
+        if component not in self._cr_cache:
+            self._cr_cache[component] = function()
+        return self._cr_cache[component]
 
-                # Modify CR
-                cr_settings["MOVEMENT"] += (
-                    CR["MOVEMENT"][movement] * thirty_feet_count
-                )
+    def get_cr_casting(self):
+        """
+        Gets our INNATECASTING and SPELLCASTING CR
+        """
+
+        # Settings
+        cr_settings = {}
+        cr_settings["INNATECASTING"] = 0
+        cr_settings["SPELLCASTING"] = 0
 
         # Innate Spellcasting
         # With Innate, we take the combined level of the Spells
@@ -495,52 +570,125 @@ class Monster:
                 self._spells.get_max_spell_level() * CR["SPELLCASTING"]
             )
 
-        # SAVING_THROWS
-        cr_settings["SAVING_THROWS"] = (
-            len(self._saving_throws_list) * CR["SAVING_THROWS"]
-        )
+        # Return
+        return cr_settings
 
-        # Senses
+    def get_cr_defense(self):
+        """
+        Gets our Defensive Challenge Rating
+        """
+
+        return cr_defense(self.get_hp_average(), self._armors.get_ac())
+
+    def get_cr_features(self):
+        """
+        What our CR is worked out from, before settings.CR weighs it.
+        Our DEFENSE/OFFENSE inputs, by CR_INPUTS, and how many of each CR
+        setting we have, by (CR setting, what it's per or None), so each
+        CR setting is the sum of its counts times their settings.CR.
+        """
+
+        # DEFENSE/OFFENSE inputs
+        cr_inputs = self.get_cr_inputs()
+
+        # Counts
+        cr_counts = Counter()
+
+        # Movements and Senses, per 30ft
+        for movement, value in self._movement_dict.items():
+            cr_counts[("MOVEMENT", movement)] += value / 30
         for sense, value in self._senses_dict.items():
-            cr_settings["SENSES"] += ((value / 30) * CR["SENSES"][sense])
+            cr_counts[("SENSES", sense)] += value / 30
 
-        # DAMAGE_RESISTANCES
-        for damage_type in self._damage_resistances_list:
-            cr_settings["DAMAGE_RESISTANCES"] += CR["DAMAGE_RESISTANCES"][damage_type]
+        # Resists/Vulnerabilities/Immunities
+        for cr_setting, types_list in [
+            ("CONDITION_IMMUNITIES", self._condition_immunities_list),
+            ("DAMAGE_IMMUNITIES", self._damage_immunities_list),
+            ("DAMAGE_RESISTANCES", self._damage_resistances_list),
+            ("DAMAGE_VULNERABILITIES", self._damage_vulnerabilities_list)
+        ]:
+            for damage_type in types_list:
+                cr_counts[(cr_setting, damage_type)] += 1
 
-        # DAMAGE_VULNERABILITIES
-        for damage_type in self._damage_vulnerabilities_list:
-            cr_settings["DAMAGE_VULNERABILITIES"] += CR["DAMAGE_VULNERABILITIES"][damage_type]
+        # SAVING_THROWS
+        cr_counts[("SAVING_THROWS", None)] = len(self._saving_throws_list)
 
-        # DAMAGE_IMMUNITIES
-        for damage_type in self._damage_immunities_list:
-            cr_settings["DAMAGE_IMMUNITIES"] += CR["DAMAGE_IMMUNITIES"][damage_type]
+        # Traits and Recharge count once per trait, as get_cr_traits.
+        if self._traits_list:
+            cr_counts[("TRAITS", None)] = (
+                len(self._traits_list) *
+                self.get_extra_trait(ExtrasEnum.CR_MODIFIER)
+            )
+            cr_counts[("RECHARGE", None)] = (
+                len(self._traits_list) * self.get_recharge_die_calculation()
+            )
 
-        # CONDITION_IMMUNITIES
-        for condition_type in self._condition_immunities_list:
-            cr_settings["CONDITION_IMMUNITIES"] += CR["CONDITION_IMMUNITIES"][condition_type]
+        # Innate, the combined level of our spells
+        if self.is_innate_caster():
+            cr_counts[("INNATECASTING", None)] = sum(
+                SPELLS[spell][SpellsEnum.LEVEL]
+                for spell in self.innate.get_spells_single_list()
+            )
 
-        # Create CR Average
-        cr_average = math.floor(
-            statistics.mean(cr_base.values()) + sum(cr_settings.values())
-        )
+        # Spellcasting, our highest level
+        if self.is_spell_caster():
+            cr_counts[("SPELLCASTING", None)] = (
+                self._spells.get_max_spell_level()
+            )
 
         # Return
-        challenge_rating = get_cr_from_row(int(cr_average))
-        return challenge_rating, cr_settings, cr_base
+        return cr_inputs, dict(cr_counts)
 
-    def get_cr_defense(self):
+    def get_cr_fingerprint(self):
         """
-        Gets our Defensive Challenge Rating
+        Fingerprint of everything our CR depends on that a variant
+        changes.  Only stat bonuses count, raw stats never reach the CR.
         """
 
-        return cr_defense(self.get_hp_average(), self._armors.get_ac())
+        return (
+            self._name,
+            tuple(
+                self._stats.get_stat_bonus(stat.value) for stat in StatsEnum
+            ),
+            tuple(sorted(
+                (weapon._name, weapon._scale)
+                for weapon in self._weapons._weapon_list
+            )),
+            tuple(sorted(
+                (armor._name, armor._ac) for armor in self._armors._armor_list
+            )),
+            (self._hit_dice_size, self._hit_dice_count),
+            (self._attacks_per_round, self._expected_cr),
+            tuple(self._traits_list)
+        )
+
+    def get_cr_inputs(self):
+        """
+        What our DEFENSE/OFFENSE rows are worked out from, by CR_INPUTS
+        """
+
+        damage_per_round, to_hit, spell_dc = self.get_cr_offense_inputs()
+        return {
+            "HP": self.get_hp_average(),
+            "AC": self._armors.get_ac(),
+            "DAMAGE_PER_ROUND": damage_per_round,
+            "ATTACK_BONUS": to_hit,
+            "SAVE_DC": spell_dc
+        }
 
     def get_cr_offense(self):
         """
         Gets our Offensive Challenge Rating
         """
 
+        return cr_offense(*self.get_cr_offense_inputs())
+
+    def get_cr_offense_inputs(self):
+        """
+        Gets what our Offensive Challenge Rating is worked out from;
+        damage per round, to hit and spell dc.
+        """
+
         # Vars to calculate and be considered
         damage_per_round = 0
         to_hit = 0
@@ -580,7 +728,150 @@ class Monster:
             to_hit = max(self.innate.get_to_hit(), to_hit)
 
         # Return
-        return cr_offense(damage_per_round, to_hit, spell_dc)
+        return damage_per_round, to_hit, spell_dc
+
+    def get_cr_plan(self):
+        """
+        Our CR Plan; the CR settings that don't depend on stats or
+        equipment and their sum, so get_cr only has to work out the
+        DEFENSE/OFFENSE rows.
+        """
+
+        # Gather the parts
+        cr_parts = {}
+        cr_parts.update(self.get_cr_cached("TRAITS", self.get_cr_traits))
+        cr_parts.update(self.get_cr_cached("CASTING", self.get_cr_casting))
+        cr_parts.update(self.get_cr_cached("STATIC", self.get_cr_static))
+
+        # Set up cr settings values, those we tweak.
+        cr_settings = {key: cr_parts[key] for key in CR_SETTINGS_KEYS}
+
+        # Return them and their sum
+        return cr_settings, sum(cr_settings.values())
+
+    def get_cr_static(self):
+        """
+        Gets the CR of what a variant never changes; movement, senses,
+        saving throws, resistances, vulnerabilities and immunities.
+        """
+
+        # Settings
+        cr_settings = {}
+        cr_settings["CONDITION_IMMUNITIES"] = 0
+        cr_settings["DAMAGE_IMMUNITIES"] = 0
+        cr_settings["DAMAGE_RESISTANCES"] = 0
+        cr_settings["DAMAGE_VULNERABILITIES"] = 0
+        cr_settings["MOVEMENT"] = 0
+        cr_settings["SAVING_THROWS"] = 0
+        cr_settings["SENSES"] = 0
+
+        # Movements
+        for movement in self._movement_dict.keys():
+
+            # This a value we check against?
+            if movement in CR["MOVEMENT"].keys():
+
+                # Divide!
+                thirty_feet_count = self._movement_dict[movement] / 30
+
+                # Modify CR
+                cr_settings["MOVEMENT"] += (
+                    CR["MOVEMENT"][movement] * thirty_feet_count
+                )
+
+        # SAVING_THROWS
+        cr_settings["SAVING_THROWS"] = (
+            len(self._saving_throws_list) * CR["SAVING_THROWS"]
+        )
+
+        # Senses
+        for sense, value in self._senses_dict.items():
+            cr_settings["SENSES"] += ((value / 30) * CR["SENSES"][sense])
+
+        # DAMAGE_RESISTANCES
+        for damage_type in self._damage_resistances_list:
+            cr_settings["DAMAGE_RESISTANCES"] += CR["DAMAGE_RESISTANCES"][damage_type]
+
+        # DAMAGE_VULNERABILITIES
+        for damage_type in self._damage_vulnerabilities_list:
+            cr_settings["DAMAGE_VULNERABILITIES"] += CR["DAMAGE_VULNERABILITIES"][damage_type]
+
+        # DAMAGE_IMMUNITIES
+        for damage_type in self._damage_immunities_list:
+            cr_settings["DAMAGE_IMMUNITIES"] += CR["DAMAGE_IMMUNITIES"][damage_type]
+
+        # CONDITION_IMMUNITIES
+        for condition_type in self._condition_immunities_list:
+            cr_settings["CONDITION_IMMUNITIES"] += CR["CONDITION_IMMUNITIES"][condition_type]
+
+        # Return
+        return cr_settings
+
+    def get_cr_traits(self):
+        """
+        Gets our TRAITS and RECHARGE CR
+        """
+
+        # Settings
+        cr_settings = {}
+        cr_settings["RECHARGE"] = 0
+        cr_settings["TRAITS"] = 0
+
+        # Check Traits
+        # If they have a CR_MODIFIER, add it.
+        for trait in self._traits_list:
+
+            # CR Modifier
+            cr_settings["TRAITS"] += (
+                self.get_extra_trait(ExtrasEnum.CR_MODIFIER) * CR["TRAITS"]
+            )
+
+            # Recharge?
+            cr_settings["RECHARGE"] += (
+                self.get_recharge_die_calculation() *
+                CR["RECHARGE"]
+            )
+
+        # Return
+        return cr_settings
+
+    def get_eligible_armor(self, armor):
+        """
+        Index of the armor compounds we could ever wear from the armor
+        catalog, each with a prototype Armor to check can_add_armor
+        against.  Built once per catalog.
+        """
+
+        # Built it already?
+        key = ("ARMOR", tuple(armor))
+        if key not in self._eligible_cache:
+            self._eligible_cache[key] = {}
+            for compound in armor:
+                prototype = self._armors.create(compound)
+                if self.can_equip_armor(prototype):
+                    self._eligible_cache[key][compound] = prototype
+
+        # Return
+        return self._eligible_cache[key]
+
+    def get_eligible_weapons(self, weapons):
+        """
+        Index of the weapon compounds we could ever hold from the weapons
+        catalog, each with a prototype Weapon to check can_add_weapon
+        against.  Built once per catalog.
+        """
+
+        # Built it already?
+        key = ("WEAPONS", tuple(weapons))
+        if key not in self._eligible_cache:
+            self._eligible_cache[key] = {}
+            for compound in weapons:
+                prototype = self._weapons.create(compound)
+                if self.can_equip_weapon(prototype):
+                    self._eligible_cache[key][compound] = prototype
+
+        # Return
+        return self._eligible_cache[key]
 
     def get_extra(self, extra, dict_to_search):
         """
@@ -599,6 +890,27 @@ class Monster:
 
         return self.get_extra(extra, TRAITS)
 
+    def get_fingerprint(self):
+        """
+        Fingerprint of what makes variants of the same monster distinct;
+        stats, hit dice, attacks, weapons, armor and traits.  Rolled HP
+        doesn't count.
+        """
+
+        return (
+            self._name,
+            str(self._stats),
+            (self._hit_dice_count, self._attacks_per_round),
+            tuple(sorted(
+                (weapon._name, weapon._scale)
+                for weapon in self._weapons._weapon_list
+            )),
+            tuple(sorted(
+                (armor._name, armor._ac) for armor in self._armors._armor_list
+            )),
+            tuple(self._traits_list)
+        )
+
     def get_formated_string(self, title, value, newline=True, dashes=True):
         """
         Returns a formated string, blank if value is empty
@@ -703,11 +1015,18 @@ class Monster:
             self._hit_dice_count
         )
 
-    def get_hp_rolled(self):
+    def get_hp_rolled(self, rng=None):
         """
-        Gets HP Rolled
+        Gets HP Rolled, from rng's stream if given one.
         """
 
+        # Our own stream?
+        if rng is not None:
+            return self.get_hp(sum(
+                rng.randint(1, self._hit_dice_size)
+                for _ in range(self._hit_dice_count)
+            ))
+
         return self.get_hp(math.ceil(self._hit_dice.roll_sum_single()))
 
     def get_list_names_string(self, title, list_of_enums):
@@ -1135,6 +1454,93 @@ class Monster:
             "", spaced_list(traits, spacer), False, False
         )
 
+    def get_variant_state(self):
+        """
+        Gets a snapshot of the state a MonsterVariant mutates; stats,
+        hp, weapons, armor, hit dice count and attacks per round.  Restore
+        it with set_variant_state.
+        """
+
+        return (
+            deepcopy(vars(self._stats)),
+            self._hp,
+            list(self._weapons._weapon_list),
+            list(self._armors._armor_list),
+            self._hit_dice_count,
+            self._attacks_per_round
+        )
+
+    def get_variant_solution(self):
+        """
+        Gets a portable snapshot of our variant state; stats, weapon and
+        armor compounds, hit dice count and attacks per round.  Unlike
+        get_variant_state it holds no Weapons or Armor, so it can be put
+        on any copy of our base monster, or saved, see
+        set_variant_solution.
+        """
+
+        return (
+            deepcopy(vars(self._stats)),
+            [weapon.get_compound() for weapon in self._weapons._weapon_list],
+            [armor.get_compound() for armor in self._armors._armor_list],
+            self._hit_dice_count,
+            self._attacks_per_round
+        )
+
+    def get_variant_copy(self):
+        """
+        Copies us for a MonsterVariant.  Our stats, equipment and the
+        lists and dicts we add to are copied, so a variant never changes
+        us.  The asset tables are read only, so they are shared with this
+        monster.
+        """
+
+        # Shallow first, this shares everything
+        monster = copy(self)
+
+        # Our own lists and dicts, to add to.
+        monster._languages_list = list(self._languages_list)
+        monster._monster_properties_list = list(
+            self._monster_properties_list
+        )
+        monster._movement_dict = dict(self._movement_dict)
+        monster._saving_throws_list = list(self._saving_throws_list)
+        monster._senses_dict = dict(self._senses_dict)
+        monster._skill_bonus_dict = dict(self._skill_bonus_dict)
+
+        # Resists/Vulnerabilities/Immunities
+        monster._condition_immunities_list = list(
+            self._condition_immunities_list
+        )
+        monster._damage_immunities_list = list(self._damage_immunities_list)
+        monster._damage_resistances_list = list(
+            self._damage_resistances_list
+        )
+        monster._damage_vulnerabilities_list = list(
+            self._damage_vulnerabilities_list
+        )
+
+        # Our own eligible equipment, what we've worked out so far holds.
+        monster._eligible_cache = dict(self._eligible_cache)
+
+        # Our own Stats, and everything that reads them
+        monster._stats = deepcopy(self._stats)
+        monster._armors = self._armors.copy_with_stats(monster._stats)
+        monster._weapons = self._weapons.copy_with_stats(monster._stats)
+        if self.is_spell_caster():
+            monster._spells = self._spells.copy_with_stats(monster._stats)
+        if self.is_innate_caster():
+            monster.innate = self.innate.copy_with_stats(monster._stats)
+
+        # Traits
+        monster._traits_list = list(self._traits_list)
+
+        # Our own CR cache, what we've cached so far still holds.
+        monster._cr_cache = dict(self._cr_cache)
+
+        # Return!
+        return monster
+
     def get_weapon_property_count(self, action_property, included=True):
         """
         Used for our Special Function
@@ -1178,6 +1584,25 @@ class Monster:
             return True
         return False
 
+    def invalidate_cr(self, *components):
+        """
+        Drops cached CR components so get_cr works them out again;
+        DEFENSE, OFFENSE, TRAITS, CASTING or STATIC.  Given none, drops
+        them all, needed if settings.CR is changed.
+        """
+
+        # All?
+        if not components:
+            self._cr_cache.clear()
+            return
+
+        # Just these, and what's built from them.
+        for component in components:
+            self._cr_cache.pop(component, None)
+            if component in CR_PLAN_COMPONENTS:
+                self._cr_cache.pop("PLAN", None)
+        self._cr_cache.pop("CR", None)
+
     def is_extra_size_or_race(self, extras):
         """
         Given an extra, does it have race or size requirements?
@@ -1238,12 +1663,24 @@ class Monster:
         # Boooo
         return False
 
+    def rebalance_stats(self, lowest_stat, rng=None):
+        """
+        Reverts our stats to lowest_stat and balances them again, from
+        rng's stream if given one.
+        """
+
+        with seeded_random(rng):
+            self._stats.revert_stats(lowest_stat)
+            self._stats.create_balanced_stats()
+        self.invalidate_cr("DEFENSE", "OFFENSE")
+
     def remove_armor(self, armor):
         """
         Removes an armor from our armor list
         """
 
         self._armors.remove(armor)
+        self.invalidate_cr("DEFENSE")
 
     def remove_saving_throw(self, saving_throw):
         """
@@ -1252,6 +1689,7 @@ class Monster:
 
         if saving_throw in self._saving_throws_list:
             self._saving_throws_list.remove(saving_throw)
+            self.invalidate_cr("STATIC")
 
     def remove_spell(self, spell, spell_level, instance):
         """
@@ -1259,6 +1697,7 @@ class Monster:
         """
 
         instance.remove(spell, spell_level)
+        self.invalidate_cr("CASTING", "OFFENSE")
 
     def remove_trait(self, trait):
         """
@@ -1267,6 +1706,7 @@ class Monster:
 
         if trait in self._traits_list:
             self._traits_list.remove(trait)
+            self.invalidate_cr("TRAITS")
 
     def remove_weapon(self, weapon):
         """
@@ -1274,6 +1714,113 @@ class Monster:
         """
 
         self._weapons.remove(weapon)
+        self.invalidate_cr("OFFENSE")
+
+    def set_armor(self, armor_list):
+        """
+        Replaces our armor list
+        """
+
+        self._armors._armor_list = list(armor_list)
+        self.invalidate_cr("DEFENSE")
+
+    def set_attacks_per_round(self, attacks_per_round):
+        """
+        Sets our Attacks Per Round
+        """
+
+        self._attacks_per_round = attacks_per_round
+        self.invalidate_cr("OFFENSE")
+
+    def set_expected_cr(self, expected_cr):
+        """
+        Sets our Expected CR, and the Prof Bonus our Weapons and Spells
+        get from it.
+        """
+
+        # Set it
+        self._expected_cr = expected_cr
+
+        # Prof Bonus
+        prof_bonus = self.get_prof_bonus()
+        self._weapons._prof_bonus = prof_bonus
+        if self.is_spell_caster():
+            self._spells._prof_bonus = prof_bonus
+        if self.is_innate_caster():
+            self.innate._prof_bonus = prof_bonus
+
+        # Our OFFENSE reads all of these.
+        self.invalidate_cr("OFFENSE")
+
+    def set_hit_dice_count(self, hit_dice_count):
+        """
+        Sets our Hit Dice Count, and our HP to its average.
+        """
+
+        self._hit_dice = Dice(self._hit_dice_size, hit_dice_count)
+        self._hit_dice_count = hit_dice_count
+        self._hp = self.get_hp_average()
+        self.invalidate_cr("DEFENSE")
+
+    def set_variant_state(self, state):
+        """
+        Restores a snapshot from get_variant_state
+        """
+
+        # Unpack
+        (
+            stats, hp, weapon_list, armor_list, hit_dice_count,
+            attacks_per_round
+        ) = state
+
+        # Stats are shared by our Armors/Weapons/Spells, so we update
+        # them in place rather than replacing the instance.
+        vars(self._stats).update(deepcopy(stats))
+
+        # Hit Dice and Attacks
+        if hit_dice_count != self._hit_dice_count:
+            self.set_hit_dice_count(hit_dice_count)
+        self._attacks_per_round = attacks_per_round
+
+        # HP and Equipment
+        self._hp = hp
+        self._weapons._weapon_list = list(weapon_list)
+        self._armors._armor_list = list(armor_list)
+        self.invalidate_cr("DEFENSE", "OFFENSE")
+
+    def set_variant_solution(self, solution):
+        """
+        Restores a snapshot from get_variant_solution.  Our HP is left
+        to the average of our hit dice.
+        """
+
+        # Unpack
+        (
+            stats, weapon_compounds, armor_compounds, hit_dice_count,
+            attacks_per_round
+        ) = solution
+
+        # Stats, hit dice and attacks
+        self.set_variant_state((
+            stats, self._hp, [], [], hit_dice_count, attacks_per_round
+        ))
+        self._hp = self.get_hp_average()
+
+        # Equipment, made against our own stats
+        self.set_weapons([
+            self._weapons.create(compound) for compound in weapon_compounds
+        ])
+        self.set_armor([
+            self._armors.create(compound) for compound in armor_compounds
+        ])
+
+    def set_weapons(self, weapon_list):
+        """
+        Replaces our weapon list
+        """
+
+        self._weapons._weapon_list = list(weapon_list)
+        self.invalidate_cr("OFFENSE")
 
     def setup_innate(self):
         """
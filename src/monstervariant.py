@@ -8,14 +8,72 @@
 """
 
 # Sys
-from copy import deepcopy
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+)
+import itertools
+import math
+from multiprocessing import Manager
+import os
 import random
+import time
+
+# Optional, but GENETIC search needs it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # Meeeaaaine
-from .enumerators import MonsterPropertiesEnum
+from .challengerating import (
+    MONSTER_STATS_BY_CR, clip_cr_row, cr_defense_batch, cr_offense_batch,
+    get_cr_from_row, get_cr_row
+)
+from .crcache import CRCache
+from .enumerators import (
+    ArmorEnum, MonsterPropertiesEnum, MonsterStatsByCrEnum, VariantSearchEnum
+)
+from .levercurves import LeverCurves, get_lever_maximums
+from .monster import CR_INPUTS
+from .solutionstore import SolutionStore
+from .tabulist import TabuList
+from .variantbounds import get_reachable_bounds
+from .variantspace import get_variant_space
+from .variantstats import VariantStats
+
+
+__all__ = [
+    "MonsterVariant", "MonsterVariantBatch", "MonsterVariantLadder",
+    "MonsterVariantRace", "MonsterVariantResult", "get_luby",
+    "get_percentiles", "get_variant_seed", "iter_variants"
+]
+
+
+# Separates a variant key's monster name, seed and options
+KEY_SEPARATOR = "|"
+
+# Letters variant key options start with, see MonsterVariant.get_key
+KEY_OPTIONS = ("l", "r", "t")
+
+# Methods VariantStats times, when instrumenting
+MONSTER_PHASES = [
+    "add_armor", "add_weapon", "get_cr", "get_hp_rolled",
+    "get_variant_state", "rebalance_stats", "remove_armor", "remove_weapon",
+    "set_variant_state"
+]
+VARIANT_PHASES = [
+    "get_child", "get_variant_cr", "mutate_guided", "mutate_random",
+    "mutate_stats", "retarget", "score_population"
+]
+
+# Per process data for create_many, set by _create_many_init
+_CREATE_MANY = {}
 
+# Per process data for create_ladder, set by _create_ladder_init
+_CREATE_LADDER = {}
 
-__all__ = ["MonsterVariant"]
+# Per process data for create_race, set by _create_race_init
+_CREATE_RACE = {}
 
 
 class MonsterVariant():
@@ -26,11 +84,83 @@ class MonsterVariant():
     # Constss
     MINIMUM_ITERATIONS = 10
 
-    def __init__(self, monster, weapons, armor, traits, spells):
+    # Guided iterations without improvement before we kick the search
+    # with a random mutation, to climb out of a local optimum.
+    GUIDED_STAGNATION_LIMIT = 25
+
+    # Genetic population, how many of the closest carry over as they are,
+    # and how many compete to be a parent.  Matches are narrow, so we keep
+    # selection light, or the population settles just short of them.
+    GENETIC_POPULATION = 24
+    GENETIC_ELITES = 2
+    GENETIC_TOURNAMENT_SIZE = 2
+
+    # Recent states GUIDED/RANDOM searches won't go back to, 0 for none.
+    TABU_SIZE = 64
+
+    # States turned down in a row before we take it that every way out is
+    # tabu, and forget our recent states.
+    TABU_REJECTION_LIMIT = 32
+
+    # Steps a warm start takes away from the solution it starts from
+    WARM_ITERATIONS = 10
+
+    # Iterations between looking at our stop event, it's in another
+    # process so looking is slow.
+    STOP_CHECK_INTERVAL = 16
+
+    # Fewest of the most attacks per round and hit dice retargeting will
+    # give us, see get_lever_maximums.
+    MAXIMUM_ATTACKS_PER_ROUND = 10
+    MAXIMUM_HIT_DICE = 40
+
+    def __init__(
+        self, monster, weapons, armor, traits, spells, seed=None,
+        cr_cache=None, target_cr=None, lever_curves=None, instrument=False,
+        tabu_size=TABU_SIZE, solution_store=None, stop_event=None
+    ):
         """
         Constructor!
+        Our seed, with the base monster and create's settings, fully
+        defines the variant, see get_key and from_key.  Without one, we
+        pick our own.
+        cr_cache is a CRCache, share one across variants of the same
+        monster to reuse CRs between searches.
+        target_cr retargets us to another CR, see retarget.  Raises a
+        ValueError if it isn't a CR.  lever_curves, the monster's
+        LeverCurves, saves retarget its binary searches.
+        instrument keeps VariantStats of our searches, on our results.
+        tabu_size is how many recent states we won't go back to, see
+        TabuList.  solution_store is a SolutionStore, we start from its
+        solutions when it has some, and add ours to it.  Setting
+        stop_event, a multiprocessing Event, stops our search as if we
+        ran out of budget, see MonsterVariantRace.
         """
 
+        # Someone else might tell us to stop
+        self._stop_event = stop_event
+        self._stop_check = 0
+        self._stopped = False
+
+        # Solutions we've found before
+        self._solution_store = solution_store
+
+        # Stats, if we are instrumenting
+        self._stats = None
+        if instrument:
+            self._stats = VariantStats()
+
+        # CRs of states we've seen
+        if cr_cache is None:
+            cr_cache = CRCache()
+        self._cr_cache = cr_cache
+
+        # Our own random stream
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self._seed = seed
+        self._random = random.Random(seed)
+
         # Store Lists
         self._armor = armor
         self._spells = spells
@@ -41,18 +171,56 @@ class MonsterVariant():
         self._iterations = 0
         self._variant_cr = -1
 
+        # Hit dice and attacks for each CR row, when we were given them
+        self._lever_curves = lever_curves
+
+        # Budgets, recent states, restarts, the solution we started from
+        # and the closest we've come, set up by create.
+        self._best = None
+        self._tabu = None
+        self._tabu_size = tabu_size
+        self._deadline = None
+        self._max_iterations = None
+        self._restart_unit = None
+        self._solution = None
+
         # Set base and copy variant
         self._base_monster = monster
-        self._variant_monster = deepcopy(monster)
+        if self._stats is not None:
+            self._variant_monster = self._stats.time(
+                "get_variant_copy", monster.get_variant_copy
+            )
+        else:
+            self._variant_monster = monster.get_variant_copy()
 
         # Get Base Monster CR
         self._base_monster_cr = self._base_monster.get_cr()
 
+        # What we are aiming for, our base CR unless given a target.
+        self._target_cr = target_cr
+        if target_cr is not None:
+            if get_cr_row(target_cr) is None:
+                raise ValueError(f"{target_cr} isn't a CR")
+            self._variant_monster.set_expected_cr(target_cr)
+        self._target_rows = self.get_target_rows()
+
+        # Equipment the base monster could ever use, built once per
+        # base monster and catalog.
+        self._eligible_armor = monster.get_eligible_armor(armor)
+        self._eligible_weapons = monster.get_eligible_weapons(weapons)
+
         # Get our lowest stat
         self._lowest_base_stat = self._base_monster._stats.get_stat(
             self._base_monster._stats.get_lowest_stat()
         )
 
+        # Most hit dice and attacks we'll pull our levers to
+        self._maximum_hit_dice, self._maximum_attacks_per_round = (
+            get_lever_maximums(
+                monster, self.MAXIMUM_HIT_DICE, self.MAXIMUM_ATTACKS_PER_ROUND
+            )
+        )
+
     def __str__(self):
         """
         To string!
@@ -60,78 +228,392 @@ class MonsterVariant():
 
         return str(self._variant_monster)
 
-    def create(self):
+    def create(
+        self, search=VariantSearchEnum.RANDOM, max_iterations=None,
+        deadline=None, restart_unit=None
+    ):
         """
         Create a Variant!
+        max_iterations and deadline (wall-clock seconds) bound the search,
+        when either runs out we keep the closest variant we found.
+        Given a restart_unit, we restart the search on a Luby schedule,
+        see create_restarting.
+        Returns a MonsterVariantResult.  Raises a ValueError, before
+        searching, if no variant could ever reach our base or target CR.
+        When retargeting, we pull our levers before searching, and can't
+        search EXHAUSTIVE.  Raises an ImportError if we search GENETIC
+        without numpy.
         """
 
-        # Reset Iteration
+        # Can we search that way?
+        if search is VariantSearchEnum.GENETIC and numpy is None:
+            raise ImportError("GENETIC search needs numpy")
+
+        # Can we get there?
+        if (
+            self._target_cr is not None and
+            search is VariantSearchEnum.EXHAUSTIVE
+        ):
+            raise ValueError("EXHAUSTIVE search can't retarget")
+        self.check_reachable()
+
+        # Reset Iteration, CR, Best, Stop and recent states
         self._iterations = 0
+        self._variant_cr = -1
+        self._best = None
+        self._stop_check = 0
+        self._stopped = False
+        self._tabu = None
+        if self._tabu_size:
+            self._tabu = TabuList(self._tabu_size)
 
-        # Let's GOOooo
-        while self._variant_cr != self._base_monster_cr:
+        # Where our CR cache counters start, it may be shared.
+        cr_cache_hits = self._cr_cache.hits
+        cr_cache_misses = self._cr_cache.misses
 
-            # Revert them stats, time to reassign!
-            self._variant_monster._stats.revert_stats(self._lowest_base_stat)
+        # Budgets
+        self._max_iterations = max_iterations
+        self._deadline = None
+        if deadline is not None:
+            self._deadline = time.monotonic() + deadline
 
-            # Balance em!
-            self._variant_monster._stats.create_balanced_stats()
+        # Restarts
+        self._restart_unit = restart_unit
 
-            # Set our new HP
-            self._variant_monster._hp = self._variant_monster.get_hp_rolled()
+        # Found some before?  Start from one of them.
+        solution = None
+        if self._solution_store is not None:
+            solution_key = self.get_solution_key()
+            solution = self._solution_store.get(solution_key, self._random)
+        self._solution = solution
 
-            # WEAPONS
-            if not self._variant_monster.has_monster_property(
-                MonsterPropertiesEnum.NO_VARIANT_WEAPON
-            ):
+        # Instrumenting?  Swap in timed methods while we search.
+        if self._stats is not None:
+            self._stats.instrument(self, VARIANT_PHASES)
+            self._stats.instrument(self._variant_monster, MONSTER_PHASES)
 
-                # Removing?
-                if random.random() > 0.5 and len(
-                    self._variant_monster._weapons._weapon_list
-                ) > 1:
+        try:
 
-                    # Remove a Random Weapon!
-                    self._variant_monster.remove_weapon(
-                        random.choice(
-                            self._variant_monster._weapons._weapon_list
-                        )
-                    )
+            # Warm start?  No need to search if it still holds up.
+            warm_start = solution is not None and self.create_warm(solution)
+            if not warm_start and restart_unit is not None:
+                self.create_restarting(search, restart_unit)
+            elif not warm_start:
+                self.create_search(search)
+
+            # Didn't make it?  Fall back on the closest we found.  Found
+            # nothing at all?  We're still the base monster, which never
+            # counts as converged.
+            converged = self.is_converged(self._variant_cr)
+            if not converged:
+                if self._best is None:
+                    self._variant_cr = self.get_variant_cr()
+                    self.set_best(self._variant_cr)
+                _, self._variant_cr, state = self._best
+                self._variant_monster.set_variant_state(state)
+
+        # Put our methods back
+        finally:
+            if self._stats is not None:
+                self._stats.release()
+                self._stats.iterations += self._iterations
+
+        # Keep what we found for next time.
+        if converged and self._solution_store is not None:
+            self._solution_store.add(
+                solution_key, self._variant_monster.get_fingerprint(),
+                self._variant_monster.get_variant_solution()
+            )
+
+        # Return how it went
+        return MonsterVariantResult(
+            converged,
+            self._iterations,
+            self.get_distance(self._variant_cr),
+            self._variant_cr[0],
+            self._variant_monster,
+            self.get_key(),
+            self._cr_cache.hits - cr_cache_hits,
+            self._cr_cache.misses - cr_cache_misses,
+            self._target_cr,
+            self._stats,
+            self._tabu.rejected if self._tabu is not None else 0,
+            warm_start
+        )
+
+    def check_reachable(self):
+        """
+        Raises a ValueError if our base CR, or its DEFENSE/OFFENSE rows,
+        are out of reach of any variant.  When retargeting, if our target
+        CR is, with hit dice and attacks as far as we pull them.  See
+        variantbounds.
+        """
+
+        # Where can variants get to, and where do we need to get to?
+        if self._target_cr is None:
+            bounds = get_reachable_bounds(
+                self._base_monster, self._eligible_weapons,
+                self._eligible_armor
+            )
+            targets = dict(
+                zip(["CR", "DEFENSE", "OFFENSE"], self._target_rows)
+            )
+
+        # Retargeting, from our base monster at the target CR.  Any
+        # DEFENSE/OFFENSE rows that average out will do.
+        else:
+            monster = self._base_monster.get_variant_copy()
+            monster.set_expected_cr(self._target_cr)
+            bounds = get_reachable_bounds(
+                monster, self._eligible_weapons, self._eligible_armor,
+                (1, self._maximum_hit_dice),
+                (1, self._maximum_attacks_per_round)
+            )
+            targets = {"CR": self._target_rows[0]}
+
+        # Check!
+        for name, row in targets.items():
+            lowest, highest = bounds[name]
+            if not lowest <= row <= highest:
+                raise ValueError(
+                    f"{self._base_monster._name} variants can't reach "
+                    f"{name} row {row}, they only reach rows {lowest} to "
+                    f"{highest}"
+                )
+
+    @staticmethod
+    def create_many(
+        monster, count, weapons, armor, traits, spells, workers=None,
+        search=VariantSearchEnum.RANDOM, max_iterations=None, deadline=None,
+        seed=None, unique=False, target_cr=None, instrument=False,
+        solution_store=None
+    ):
+        """
+        Creates count variants of monster across a process pool.  Returns
+        a MonsterVariantBatch, iterate it for each MonsterVariantResult as
+        soon as it finishes.  With unique, duplicate variants, and those
+        that didn't converge, are skipped.
+        """
+
+        return MonsterVariantBatch(
+            monster, count, weapons, armor, traits, spells, workers,
+            search, max_iterations, deadline, seed, unique,
+            target_cr=target_cr, instrument=instrument,
+            solution_store=solution_store
+        )
+
+    def create_exhaustive(self):
+        """
+        Picks at random from the variants we found that match our base
+        CR.  The first pick for a monster enumerates its VariantSpace, which
+        raises a ValueError if there are too many variants.  Enumerating
+        is done once, so isn't an iteration; running out of time stops it
+        where it is, see is_enumeration_over_budget.  A pick is an
+        iteration, and if none match we don't converge.
+        """
+
+        # Our variants, enumerated once per base monster.
+        space = get_variant_space(
+            self._base_monster, self._weapons, self._armor, self._cr_cache,
+            self.is_enumeration_over_budget
+        )
+
+        # Pick one, if we found any.
+        self._iterations += 1
+        candidate = space.get_match(self._random)
+        if candidate is None:
+            return
+        space.set_candidate(self._variant_monster, candidate)
+
+        # Set our new HP
+        self._variant_monster._hp = self._variant_monster.get_hp_rolled(
+            self._random
+        )
+
+        # Done, in one.
+        self._variant_cr = self.get_variant_cr()
+        if self._stats is not None:
+            self._stats.add_iteration(
+                self.get_distance(self._variant_cr), True
+            )
+
+    def create_genetic(self):
+        """
+        Evolves a population of variants toward our target CR.  Each
+        generation is scored in one pass, see score_population, and the
+        first member to land is our success.  The closest carry over, the
+        rest are children of tournament winners, see get_child; twins
+        mutate again, at random.
+        """
+
+        # Starting population, scrambles of our variant
+        population = []
+        for _ in range(self.GENETIC_POPULATION):
+            self.mutate_random()
+            population.append(self._variant_monster.get_variant_state())
 
-                # Adding!
-                elif len(self._variant_monster._weapons._weapon_list) < 3:
+        # Evolve!
+        while True:
 
-                    # Get a Random Weapon!
-                    random_weapon = random.choice(list(self._weapons))
+            # Score and rank them
+            scores = self.score_population(population)
+            ranked = sorted(range(len(scores)), key=lambda i: scores[i][0])
 
-                    # Creates the Random Weapon
-                    self._variant_monster.add_weapon(random_weapon)
+            # Count them, kept if they carry over as they are.
+            if self._stats is not None:
+                elites = set(ranked[:self.GENETIC_ELITES])
+                for i, (distance, _) in enumerate(scores):
+                    self._stats.add_iteration(distance, i in elites)
 
-            # ARMOR
-            if not self._variant_monster.has_monster_property(
-                MonsterPropertiesEnum.NO_VARIANT_ARMOR
+            # Our closest, unless the last we scored landed.
+            closest = ranked[0]
+            if self.is_converged(scores[-1][1]):
+                closest = len(scores) - 1
+            distance, self._variant_cr = scores[closest]
+            self._variant_monster.set_variant_state(population[closest])
+            self.set_best(self._variant_cr, distance)
+
+            # Done?
+            if (
+                self.is_converged(self._variant_cr) or
+                self.is_over_budget()
             ):
+                return
 
-                # Removing?
-                # Unlike Weapon, we are okay with the
-                # creature not having Armor.
-                if random.random() > 0.5:
-
-                    # Remove a Random Armor!
-                    if len(self._variant_monster._armors._armor_list):
-                        self._variant_monster.remove_armor(
-                            random.choice(
-                                self._variant_monster._armors._armor_list
-                            )
-                        )
+            # Next generation, elites first.
+            children = [population[i] for i in ranked[:self.GENETIC_ELITES]]
+            fingerprints = set()
+            for child in children:
+                self._variant_monster.set_variant_state(child)
+                fingerprints.add(self._variant_monster.get_cr_fingerprint())
+            while len(children) < self.GENETIC_POPULATION:
+                mother = self.get_tournament_winner(scores)
+                father = self.get_tournament_winner(scores)
+                closer = min(mother, father, key=lambda i: scores[i][0])
+                self.get_child(
+                    population[mother], population[father],
+                    scores[closer][1]
+                )
 
-                # Adding!
+                # A twin?  Mutate it, so we don't breed ourselves into a
+                # corner.
+                fingerprint = self._variant_monster.get_cr_fingerprint()
+                if fingerprint in fingerprints:
+                    self.mutate_random()
+                    fingerprint = self._variant_monster.get_cr_fingerprint()
+                fingerprints.add(fingerprint)
+                children.append(self._variant_monster.get_variant_state())
+            population = children
+
+    def create_guided(self):
+        """
+        Hill-climbs toward our base CR.  Each iteration picks a mutation
+        from how far the DEFENSE/OFFENSE rows are off, and only keeps it
+        if it doesn't move us further away.  Equipment is tried before
+        stats, it moves a row without shaking the other.  Where random
+        variants rarely land on our CR, this works out an order of
+        magnitude fewer CRs than RANDOM; where they often do, it's no
+        better, see Benchmark Searches.
+        """
+
+        # Scramble first, so we don't hand back the base monster.  No
+        # need when retargeting, retarget already moved us.
+        if self._target_cr is None:
+            for _ in range(self.MINIMUM_ITERATIONS):
+                self.mutate_random()
+                self._iterations += 1
+
+        # Where are we starting?  No coming back here.
+        self._variant_cr = self.get_variant_cr()
+        distance = self.get_distance(self._variant_cr)
+        self.set_best(self._variant_cr)
+        self.is_tabu()
+
+        # Iterations since we last got closer
+        stagnation = 0
+
+        # Climb!
+        while (
+            not self.is_converged(self._variant_cr) and
+            not self.is_over_budget()
+        ):
+
+            # Snapshot, in case this goes poorly.
+            state = self._variant_monster.get_variant_state()
+
+            # Stuck?  Kick it and take whatever we get.
+            kicked = stagnation >= self.GUIDED_STAGNATION_LIMIT
+            if kicked:
+                self.mutate_random()
+            else:
+                self.mutate_guided(self._variant_cr)
+
+            # Been here recently?  Put it back without a CR.
+            if self.is_tabu():
+                self._variant_monster.set_variant_state(state)
+                stagnation += 1
+                self._iterations += 1
+                continue
+
+            # How'd we do?
+            variant_cr = self.get_variant_cr()
+            variant_distance = self.get_distance(variant_cr)
+
+            # Keep it?
+            accepted = kicked or variant_distance <= distance
+            if accepted:
+                if variant_distance < distance:
+                    stagnation = 0
                 else:
+                    stagnation += 1
+                self._variant_cr = variant_cr
+                distance = variant_distance
+                self.set_best(variant_cr, variant_distance)
+
+            # Nope, put it back.
+            else:
+                self._variant_monster.set_variant_state(state)
+                stagnation += 1
+
+            # Count it
+            if self._stats is not None:
+                self._stats.add_iteration(variant_distance, accepted)
+
+            # Iterate!
+            self._iterations += 1
+
+    @staticmethod
+    def create_ladder(
+        monster, weapons, armor, traits, spells, workers=None,
+        search=VariantSearchEnum.GUIDED, max_iterations=None, deadline=None,
+        seed=None, records=False, instrument=False
+    ):
+        """
+        Creates one variant of monster at every CR it can reach, across a
+        process pool.  Without max_iterations or deadline, each rung gets
+        MonsterVariantLadder.RUNG_ITERATIONS.  Returns a
+        MonsterVariantLadder, iterate it for each MonsterVariantResult as
+        soon as it finishes.
+        """
+
+        return MonsterVariantLadder(
+            monster, weapons, armor, traits, spells, workers, search,
+            max_iterations, deadline, seed, records, instrument
+        )
+
+    def create_random(self):
+        """
+        Blind random restarts until we land on our base CR.
+        """
 
-                    # Get a Random Armor!
-                    random_armor = random.choice(list(self._armor))
+        # Let's GOOooo
+        while (
+            not self.is_converged(self._variant_cr) and
+            not self.is_over_budget()
+        ):
 
-                    # Creates the Random Armor
-                    self._variant_monster.add_armor(random_armor)
+            # Mutate!
+            self.mutate_random()
 
             # TRAITS
 
@@ -142,11 +624,1641 @@ class MonsterVariant():
             # We want a minimum number of iterations, so we
             # don't begin updating until after those happen.
             if self._iterations > self.MINIMUM_ITERATIONS:
-                self._variant_cr = self._variant_monster.get_cr()
+
+                # Been here recently?  Move on without a CR.
+                if self.is_tabu():
+                    self._iterations += 1
+                    continue
+
+                self._variant_cr = self.get_variant_cr()
+                accepted = self.set_best(self._variant_cr)
+
+                # Count it, kept if it's our closest yet.
+                if self._stats is not None:
+                    self._stats.add_iteration(
+                        self.get_distance(self._variant_cr), accepted
+                    )
+
+            # Iterate!
+            self._iterations += 1
+
+    @staticmethod
+    def create_race(
+        monster, weapons, armor, traits, spells, racers=None, workers=None,
+        search=VariantSearchEnum.RANDOM, max_iterations=None, deadline=None,
+        seed=None, restart_unit=None, target_cr=None
+    ):
+        """
+        Races racers searches for each variant across a process pool,
+        taking the first to converge.  Returns a MonsterVariantRace, call
+        run for each variant.
+        """
+
+        return MonsterVariantRace(
+            monster, weapons, armor, traits, spells, racers, workers,
+            search, max_iterations, deadline, seed, restart_unit, target_cr
+        )
+
+    def create_restarting(self, search, restart_unit):
+        """
+        Runs search in restarts of get_luby(run) * restart_unit
+        iterations, from our starting state each time, until we converge
+        or run out of budget.  A long unlucky search is cut short rather
+        than left to wander, while the growing runs still give slow
+        searches the iterations they need.
+        """
+
+        # Where each run starts from, and our real budget
+        state = self._variant_monster.get_variant_state()
+        max_iterations = self._max_iterations
+
+        # Run!
+        for run in itertools.count(1):
+
+            # This run's budget
+            self._max_iterations = self._iterations + (
+                get_luby(run) * restart_unit
+            )
+            if max_iterations is not None:
+                self._max_iterations = min(
+                    self._max_iterations, max_iterations
+                )
+            self.create_search(search)
+
+            # Done, or out of our real budget?
+            self._max_iterations = max_iterations
+            if (
+                self.is_converged(self._variant_cr) or
+                self.is_over_budget()
+            ):
+                return
+
+            # Start again, keeping the closest we've found.
+            self._variant_monster.set_variant_state(state)
+
+    def create_search(self, search):
+        """
+        Searches for our target CR with the given VariantSearchEnum,
+        pulling our levers first if we are retargeting.
+        """
+
+        # Retargeting?  Get close before we search.
+        if self._target_cr is not None:
+            self.retarget()
+
+        # Which search?
+        if search is VariantSearchEnum.EXHAUSTIVE:
+            self.create_exhaustive()
+        elif search is VariantSearchEnum.GENETIC:
+            self.create_genetic()
+        elif search is VariantSearchEnum.GUIDED:
+            self.create_guided()
+        else:
+            self.create_random()
+
+    def create_warm(self, solution):
+        """
+        Starts from a solution that matched before, then wanders away
+        from it, only taking steps that keep our CR.  Every step we keep
+        matches, so we are done in WARM_ITERATIONS.  Returns False, and
+        leaves the searching to create, if the solution doesn't match.
+        """
+
+        # Start there
+        self._variant_monster.set_variant_solution(solution)
+        self._variant_monster._hp = self._variant_monster.get_hp_rolled(
+            self._random
+        )
+        self._variant_cr = self.get_variant_cr()
+        self.set_best(self._variant_cr)
+
+        # Still good?
+        if not self.is_converged(self._variant_cr):
+            return False
+
+        # Wander
+        for _ in range(self.WARM_ITERATIONS):
+
+            # Out of budget?  We're good where we are.
+            if self.is_over_budget():
+                break
+
+            # Step
+            state = self._variant_monster.get_variant_state()
+            self.mutate_random()
+            variant_cr = self.get_variant_cr()
+
+            # Keep it if it still matches, otherwise step back.
+            accepted = self.is_converged(variant_cr)
+            if accepted:
+                self._variant_cr = variant_cr
+            else:
+                self._variant_monster.set_variant_state(state)
+
+            # Count it
+            if self._stats is not None:
+                self._stats.add_iteration(
+                    self.get_distance(variant_cr), accepted
+                )
 
             # Iterate!
             self._iterations += 1
 
+        # Return
+        return True
+
+    @staticmethod
+    def from_key(
+        key, monsters, weapons, armor, traits, spells,
+        search=VariantSearchEnum.RANDOM, max_iterations=None, target_cr=None
+    ):
+        """
+        Rebuilds a variant from its get_key, given the same monsters dict
+        and create settings it was made with.  Options in the key, see
+        get_key, are set up as they were.  Variants cut short by a
+        deadline can't be rebuilt, where they stop depends on the clock.
+        """
+
+        # Split it, options trail the seed and start with their letter.
+        # Seeds can be negative, so anything else is the seed.
+        parts = key.split(KEY_SEPARATOR)
+        options = {}
+        while parts[-1][:1] in KEY_OPTIONS:
+            option = parts.pop()
+            options[option[0]] = option[1:]
+        seed = int(parts.pop())
+        monster = monsters[KEY_SEPARATOR.join(parts)]
+
+        # LeverCurves, as a ladder builds them
+        lever_curves = None
+        if "l" in options:
+            lever_curves = LeverCurves(
+                monster, *get_lever_maximums(
+                    monster, MonsterVariant.MAXIMUM_HIT_DICE,
+                    MonsterVariant.MAXIMUM_ATTACKS_PER_ROUND
+                )
+            )
+
+        # Restarts
+        restart_unit = None
+        if "r" in options:
+            restart_unit = int(options["r"])
+
+        # Build it again
+        variant = MonsterVariant(
+            monster, weapons, armor, traits, spells, seed,
+            target_cr=target_cr, lever_curves=lever_curves,
+            tabu_size=int(options.get("t", MonsterVariant.TABU_SIZE))
+        )
+        variant.create(search, max_iterations, restart_unit=restart_unit)
+        return variant
+
+    def get_addable_armor(self):
+        """
+        Eligible armor compounds our variant can put on right now.
+        """
+
+        return [
+            compound for compound, armor in self._eligible_armor.items()
+            if self._variant_monster.can_add_armor(armor)
+        ]
+
+    def get_addable_weapons(self):
+        """
+        Eligible weapon compounds our variant can take right now.
+        """
+
+        return [
+            compound for compound, weapon in self._eligible_weapons.items()
+            if self._variant_monster.can_add_weapon(weapon)
+        ]
+
+    def get_child(self, mother, father, variant_cr):
+        """
+        Breeds two get_variant_state snapshots.  Stat lines are kept
+        whole, mixing stats would undo their balance, so the child takes
+        one parent's.  Armor and hit dice come together from one parent,
+        weapons and attacks from one parent.  Then it mutates toward our
+        target, guided by variant_cr, the closer parent's CR, see
+        mutate_guided.  Returns the child's snapshot.
+        """
+
+        # Pick our parents' genes
+        stats, _, _, _, _, _ = self._random.choice((mother, father))
+        _, hp, _, armor_list, hit_dice_count, _ = self._random.choice(
+            (mother, father)
+        )
+        _, _, weapon_list, _, _, attacks_per_round = self._random.choice(
+            (mother, father)
+        )
+
+        # Put them together
+        self._variant_monster.set_variant_state((
+            stats, hp, weapon_list, [], hit_dice_count, attacks_per_round
+        ))
+
+        # Armor might need more STR than our stat line has.
+        for armor in armor_list:
+            if self._variant_monster.can_add_armor(armor):
+                self._variant_monster.set_armor(
+                    self._variant_monster._armors._armor_list + [armor]
+                )
+
+        # Mutate, from where the closer parent was.
+        self.mutate_guided(variant_cr)
+
+        # Return
+        return self._variant_monster.get_variant_state()
+
+    def get_distance(self, variant_cr):
+        """
+        How many CR rows are we off from our target, counting the
+        DEFENSE/OFFENSE rows as well as the final CR.
+        """
+
+        # Unpack
+        cr, _, cr_base = variant_cr
+        cr_row, defense, offense = self._target_rows
+
+        # Distance!
+        return (
+            abs(get_cr_row(cr) - cr_row) +
+            abs(cr_base["DEFENSE"] - defense) +
+            abs(cr_base["OFFENSE"] - offense)
+        )
+
+    def get_key(self):
+        """
+        A compact key for this variant, base monster name and seed, then
+        any options that change our search; t and our tabu_size if it
+        isn't TABU_SIZE, r and our restart_unit, and l if we were given
+        LeverCurves.  None if we started from a SolutionStore solution,
+        what the store held isn't ours to rebuild.
+        """
+
+        # Started from a stored solution?
+        if self._solution is not None:
+            return None
+
+        # Name and seed
+        parts = [self._base_monster._name, str(self._seed)]
+
+        # Options
+        if self._tabu_size != self.TABU_SIZE:
+            parts.append(f"t{self._tabu_size}")
+        if self._restart_unit is not None:
+            parts.append(f"r{self._restart_unit}")
+        if self._lever_curves is not None:
+            parts.append("l")
+
+        # Return
+        return KEY_SEPARATOR.join(parts)
+
+    def get_solution_key(self):
+        """
+        Our SolutionStore key
+        """
+
+        return SolutionStore.get_key(
+            self._base_monster, self._weapons, self._armor, self._target_cr
+        )
+
+    def get_target_rows(self):
+        """
+        The CR, DEFENSE and OFFENSE rows we are aiming for.  Our base
+        monster's, or when retargeting, DEFENSE and OFFENSE rows that
+        average out, with our CR settings, to the target CR.
+        """
+
+        # Base?
+        if self._target_cr is None:
+            cr, _, cr_base = self._base_monster_cr
+            return get_cr_row(cr), cr_base["DEFENSE"], cr_base["OFFENSE"]
+
+        # Our CR settings add on top of the DEFENSE/OFFENSE average.
+        cr_row = get_cr_row(self._target_cr)
+        _, cr_settings_sum = self._variant_monster.get_cr_cached(
+            "PLAN", self._variant_monster.get_cr_plan
+        )
+        row = min(
+            max(cr_row - math.floor(cr_settings_sum), 0),
+            len(MONSTER_STATS_BY_CR) - 1
+        )
+
+        # Return
+        return cr_row, row, row
+
+    def get_tournament_winner(self, scores):
+        """
+        Index of the closest of GENETIC_TOURNAMENT_SIZE random scores
+        """
+
+        return min(
+            self._random.sample(
+                range(len(scores)),
+                min(self.GENETIC_TOURNAMENT_SIZE, len(scores))
+            ),
+            key=lambda i: scores[i][0]
+        )
+
+    def get_variant_cr(self):
+        """
+        Gets our variant's CR, through our CR cache.
+        """
+
+        return self._cr_cache.get_cr(self._variant_monster)
+
+    def is_converged(self, variant_cr):
+        """
+        Have we landed on our base CR, or our target CR when retargeting?
+        """
+
+        if self._target_cr is None:
+            return variant_cr == self._base_monster_cr
+        return variant_cr[0] == self._target_cr
+
+    def is_tabu(self):
+        """
+        Has our variant been in this state recently?  If not, remembers
+        it for next time.  Only ask of states we are about to evaluate.
+        After TABU_REJECTION_LIMIT in a row, we forget our recent states
+        and let this one through, rather than spin.
+        """
+
+        # Not keeping any?
+        if self._tabu is None:
+            return False
+
+        # New?
+        fingerprint = self._variant_monster.get_cr_fingerprint()
+        if self._tabu.add(fingerprint):
+            return False
+
+        # Boxed in?  Start over from here.
+        if self._tabu.streak >= self.TABU_REJECTION_LIMIT:
+            self._tabu.clear()
+            self._tabu.add(fingerprint)
+            return False
+
+        # Tabu!
+        return True
+
+    def is_enumeration_over_budget(self):
+        """
+        Have we run out of time, or been told to stop, while enumerating
+        our VariantSpace?  Iterations don't count, enumerating isn't part
+        of any one search.
+        """
+
+        # Time
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return True
+
+        # Told to stop?
+        if self._stop_event is not None:
+            self._stopped = self._stopped or self._stop_event.is_set()
+        return self._stopped
+
+    def is_over_budget(self):
+        """
+        Have we run out of iterations or time, or been told to stop?
+        """
+
+        # Iterations
+        if (
+            self._max_iterations is not None and
+            self._iterations >= self._max_iterations
+        ):
+            return True
+
+        # Time
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return True
+
+        # Told to stop?  Only ask every so often.
+        if self._stop_event is not None and (
+            self._iterations >= self._stop_check
+        ):
+            self._stop_check = self._iterations + self.STOP_CHECK_INTERVAL
+            self._stopped = self._stopped or self._stop_event.is_set()
+        if self._stopped:
+            return True
+
+        # Keep going!
+        return False
+
+    def mutate_attacks(self, lower):
+        """
+        One less or one more attack per round.  Returns True if it
+        changed.
+        """
+
+        # Where to?
+        attacks_per_round = self._variant_monster._attacks_per_round
+        attacks_per_round += -1 if lower else 1
+        if not 1 <= attacks_per_round <= self._maximum_attacks_per_round:
+            return False
+
+        # Set it
+        self._variant_monster.set_attacks_per_round(attacks_per_round)
+        return True
+
+    def mutate_armor(self, lower):
+        """
+        Swaps, adds or removes armor to lower or raise our AC.  Returns
+        True if our AC moved the way we wanted.
+        """
+
+        # Armors and AC we are starting from
+        armors = self._variant_monster._armors
+        armor_list = list(armors._armor_list)
+        ac = armors.get_ac()
+
+        # Lowering?  Taking armor off is the simplest.
+        if lower:
+            if armor_list:
+                self._variant_monster.remove_armor(
+                    self._random.choice(armor_list)
+                )
+            return armors.get_ac() < ac
+
+        # Raising, try what we could wear in a random order.
+        compounds = list(self._eligible_armor)
+        self._random.shuffle(compounds)
+        for compound in compounds:
+
+            # Swap out whatever is in this slot.
+            armor = armors.create(compound)
+            current = armors.get_slot(armor._data[ArmorEnum.SLOT])
+            if current is not None:
+                self._variant_monster.remove_armor(current)
+
+            # Better?
+            self._variant_monster.add_armor(compound)
+            if armors.get_ac() > ac:
+                return True
+
+            # Nope, put it back.
+            self._variant_monster.set_armor(armor_list)
+
+        # Nothing helped
+        return False
+
+    def mutate_defense(self, lower):
+        """
+        Lowers or raises our Defensive CR; our hit dice when retargeting,
+        AC through armor, or failing that, our stats and then armor to
+        suit them.
+        """
+
+        # Hit Dice, if we are retargeting.
+        if (
+            self._target_cr is not None and self._random.random() > 0.5 and
+            self.mutate_hit_dice(lower)
+        ):
+            return
+
+        # Armor, if we are allowed to touch it.
+        armor = not self._variant_monster.has_monster_property(
+            MonsterPropertiesEnum.NO_VARIANT_ARMOR
+        )
+        if armor and self.mutate_armor(lower):
+            return
+
+        # Otherwise our stats, CON for HP and DEX for AC, then armor that
+        # suits them.
+        self.mutate_stats()
+        if armor:
+            self.mutate_armor(lower)
+
+    def mutate_guided(self, variant_cr):
+        """
+        Picks a mutation that moves the DEFENSE/OFFENSE rows toward
+        our target rows.
+        """
+
+        # How far off is each row?
+        _, _, cr_base = variant_cr
+        _, target_defense, target_offense = self._target_rows
+        defense = cr_base["DEFENSE"] - target_defense
+        offense = cr_base["OFFENSE"] - target_offense
+
+        # Levers we can pull
+        levers = []
+        if defense:
+            levers.append((self.mutate_defense, defense))
+        if offense:
+            levers.append((self.mutate_offense, offense))
+
+        # Rows line up but the CR doesn't?  Shake up the stats.
+        if not levers:
+            self.mutate_stats()
+            return
+
+        # Pull one, lowering if we are above the target.
+        mutate, difference = self._random.choice(levers)
+        mutate(difference > 0)
+
+    def mutate_hit_dice(self, lower):
+        """
+        One less or one more hit die.  Returns True if it changed.
+        """
+
+        # Where to?
+        hit_dice_count = self._variant_monster._hit_dice_count
+        hit_dice_count += -1 if lower else 1
+        if not 1 <= hit_dice_count <= self._maximum_hit_dice:
+            return False
+
+        # Set it, and roll our HP again.
+        self._variant_monster.set_hit_dice_count(hit_dice_count)
+        self._variant_monster._hp = self._variant_monster.get_hp_rolled(
+            self._random
+        )
+        return True
+
+    def mutate_offense(self, lower):
+        """
+        Lowers or raises our Offensive CR; our attacks when retargeting,
+        DPR through weapons, or failing that, our stats and then weapons
+        to suit them.
+        """
+
+        # Attacks, if we are retargeting.
+        if (
+            self._target_cr is not None and self._random.random() > 0.5 and
+            self.mutate_attacks(lower)
+        ):
+            return
+
+        # Weapons, if we are allowed to touch them.
+        weapons = not self._variant_monster.has_monster_property(
+            MonsterPropertiesEnum.NO_VARIANT_WEAPON
+        )
+        if weapons and self.mutate_weapons(lower):
+            return
+
+        # Otherwise our stats, STR/DEX for damage and to hit, then weapons
+        # that suit them.
+        self.mutate_stats()
+        if weapons:
+            self.mutate_weapons(lower)
+
+    def mutate_random(self):
+        """
+        Random mutation, re-rolls stats and hp, then adds or removes
+        a random weapon and armor.
+        """
+
+        # Stats and HP
+        self.mutate_stats()
+
+        # WEAPONS
+        if not self._variant_monster.has_monster_property(
+            MonsterPropertiesEnum.NO_VARIANT_WEAPON
+        ):
+
+            # Removing?
+            if self._random.random() > 0.5 and len(
+                self._variant_monster._weapons._weapon_list
+            ) > 1:
+
+                # Remove a Random Weapon!
+                self._variant_monster.remove_weapon(
+                    self._random.choice(
+                        self._variant_monster._weapons._weapon_list
+                    )
+                )
+
+            # Adding!
+            elif len(self._variant_monster._weapons._weapon_list) < 3:
+
+                # Get a Random Weapon we can take!
+                compounds = self.get_addable_weapons()
+
+                # Creates the Random Weapon
+                if compounds:
+                    self._variant_monster.add_weapon(
+                        self._random.choice(compounds)
+                    )
+
+        # ARMOR
+        if not self._variant_monster.has_monster_property(
+            MonsterPropertiesEnum.NO_VARIANT_ARMOR
+        ):
+
+            # Removing?
+            # Unlike Weapon, we are okay with the
+            # creature not having Armor.
+            if self._random.random() > 0.5:
+
+                # Remove a Random Armor!
+                if len(self._variant_monster._armors._armor_list):
+                    self._variant_monster.remove_armor(
+                        self._random.choice(
+                            self._variant_monster._armors._armor_list
+                        )
+                    )
+
+            # Adding!
+            else:
+
+                # Get a Random Armor we can put on!
+                compounds = self.get_addable_armor()
+
+                # Creates the Random Armor
+                if compounds:
+                    self._variant_monster.add_armor(
+                        self._random.choice(compounds)
+                    )
+
+    def mutate_stats(self):
+        """
+        Re-balances our stats and re-rolls our HP.
+        """
+
+        # Revert them stats and balance em!
+        self._variant_monster.rebalance_stats(
+            self._lowest_base_stat, self._random
+        )
+
+        # Set our new HP
+        self._variant_monster._hp = self._variant_monster.get_hp_rolled(
+            self._random
+        )
+
+    def mutate_weapons(self, lower):
+        """
+        Swaps in a weaker or stronger weapon.  Returns True if our max DPR
+        moved the way we wanted.
+        """
+
+        # Weapons and DPR we are starting from
+        weapons = self._variant_monster._weapons
+        weapon_list = list(weapons._weapon_list)
+        damage_per_round = weapons.get_dpr_max()
+
+        # Nothing to swap?
+        if not weapon_list:
+            return False
+
+        # We swap out our strongest when lowering, weakest when raising.
+        if lower:
+            swap = max(weapon_list, key=lambda w: w.get_dpr())
+        else:
+            swap = min(weapon_list, key=lambda w: w.get_dpr())
+
+        # Lowering with a spare weapon?  Just drop the strongest.
+        if (
+            lower and len(weapon_list) > 1 and self._random.random() > 0.5
+        ):
+            self._variant_monster.remove_weapon(swap)
+            if weapons.get_dpr_max() < damage_per_round:
+                return True
+            self._variant_monster.set_weapons(weapon_list)
+
+        # Try what we could hold in a random order.
+        compounds = list(self._eligible_weapons)
+        self._random.shuffle(compounds)
+        for compound in compounds:
+
+            # Only bother with weapons that go the right way.
+            dpr = weapons.create(compound).get_dpr()
+            if (lower and dpr >= swap.get_dpr()) or (
+                not lower and dpr <= swap.get_dpr()
+            ):
+                continue
+
+            # Swap!  When raising with room, we keep what we have.
+            if lower or len(weapon_list) >= 3:
+                self._variant_monster.remove_weapon(swap)
+            self._variant_monster.add_weapon(compound)
+
+            # Did it work?
+            if (lower and weapons.get_dpr_max() < damage_per_round) or (
+                not lower and weapons.get_dpr_max() > damage_per_round
+            ):
+                return True
+
+            # Nope, put it back.
+            self._variant_monster.set_weapons(weapon_list)
+
+        # Nothing helped
+        return False
+
+    def retarget(self):
+        """
+        Gets us close to our target CR in a few dozen CR calculations.
+        HP only goes up with hit dice, and DPR with attacks, so we binary
+        search each for the DEFENSE and OFFENSE rows we are aiming for,
+        from freshly balanced stats.  Given LeverCurves, we look them up
+        instead and leave the rest to our search.
+        """
+
+        # Fresh stats
+        self.mutate_stats()
+
+        # Rows we are aiming for
+        _, defense, offense = self._target_rows
+        monster = self._variant_monster
+
+        # Looked up already?
+        if self._lever_curves is not None:
+            monster.set_hit_dice_count(
+                self._lever_curves.get_hit_dice_count(defense)
+            )
+            monster.set_attacks_per_round(
+                self._lever_curves.get_attacks_per_round(offense)
+            )
+
+        # Otherwise, search them.
+        else:
+
+            # DEFENSE, through hit dice
+            self.search_lever(
+                monster.set_hit_dice_count,
+                lambda: monster.get_cr_cached(
+                    "DEFENSE", monster.get_cr_defense
+                ),
+                1, self._maximum_hit_dice, defense
+            )
+
+            # OFFENSE, through attacks
+            self.search_lever(
+                monster.set_attacks_per_round,
+                lambda: monster.get_cr_cached(
+                    "OFFENSE", monster.get_cr_offense
+                ),
+                1, self._maximum_attacks_per_round, offense
+            )
+
+        # Roll our HP for the hit dice we ended on.
+        monster._hp = monster.get_hp_rolled(self._random)
+
+        # Where did we get to?
+        self._variant_cr = self.get_variant_cr()
+        self.set_best(self._variant_cr)
+
+    def score_population(self, population):
+        """
+        Scores a population of get_variant_state snapshots, returning
+        (distance, variant_cr) for each.  CRs our cache doesn't have are
+        worked out together, from each member's get_cr_inputs, by the
+        batch CR functions.  Each member scored is an iteration; we stop
+        at the first that converges, or when we run out of iterations, so
+        the last score might be a success and there might be fewer scores
+        than population.
+        """
+
+        # No more than we have iterations for
+        if self._max_iterations is not None:
+            population = population[
+                :max(1, self._max_iterations - self._iterations)
+            ]
+
+        # Look each up, gathering the inputs of those we haven't seen.
+        fingerprints = []
+        crs = {}
+        inputs = {}
+        for state in population:
+            self._variant_monster.set_variant_state(state)
+            fingerprint = self._variant_monster.get_cr_fingerprint()
+            fingerprints.append(fingerprint)
+            if fingerprint in crs or fingerprint in inputs:
+                continue
+            variant_cr = self._cr_cache.get(fingerprint)
+            if variant_cr is None:
+                inputs[fingerprint] = self._variant_monster.get_cr_inputs()
+            else:
+                crs[fingerprint] = variant_cr
+
+        # Work out the rest at once, as Monster.get_cr does.  Our plan
+        # doesn't change with our state.
+        if inputs:
+            columns = {
+                column: numpy.array(
+                    [cr_inputs[column] for cr_inputs in inputs.values()],
+                    dtype=float
+                )
+                for column in CR_INPUTS
+            }
+            defense = cr_defense_batch(columns["HP"], columns["AC"])
+            offense = cr_offense_batch(
+                columns["DAMAGE_PER_ROUND"], columns["ATTACK_BONUS"],
+                columns["SAVE_DC"]
+            )
+            cr_settings, cr_settings_sum = self._variant_monster.get_cr_cached(
+                "PLAN", self._variant_monster.get_cr_plan
+            )
+            rows = clip_cr_row(
+                numpy.floor((defense + offense) / 2 + cr_settings_sum)
+                .astype(int)
+            )
+            for fingerprint, cr_defense, cr_offense, row in zip(
+                inputs, defense.tolist(), offense.tolist(), rows.tolist()
+            ):
+                crs[fingerprint] = (
+                    get_cr_from_row(row), cr_settings,
+                    {"DEFENSE": cr_defense, "OFFENSE": cr_offense}
+                )
+                self._cr_cache.add(fingerprint, crs[fingerprint])
+
+        # Score them, in order.
+        scores = []
+        for fingerprint in fingerprints:
+            variant_cr = crs[fingerprint]
+            scores.append((self.get_distance(variant_cr), variant_cr))
+            self._iterations += 1
+
+            # Landed?  No need for the rest.
+            if self.is_converged(variant_cr):
+                break
+
+        # Return
+        return scores
+
+    def search_lever(self, set_lever, get_row, lowest, highest, row):
+        """
+        Binary searches a lever, from lowest to highest, for the value
+        whose get_row is closest to row.  set_lever sets it, and raising
+        the lever must never lower get_row.  Leaves the lever there.
+        """
+
+        # Lowest value at or above our row, or highest if none are.
+        low = lowest
+        high = highest
+        while low < high:
+            middle = (low + high) // 2
+            set_lever(middle)
+            self._iterations += 1
+            if get_row() < row:
+                low = middle + 1
+            else:
+                high = middle
+
+        # Might the one below be as close?  Less is more.
+        set_lever(low)
+        above = abs(get_row() - row)
+        if low > lowest:
+            set_lever(low - 1)
+            if abs(get_row() - row) <= above:
+                return
+            set_lever(low)
+
+    def set_best(self, variant_cr, distance=None):
+        """
+        Keeps a snapshot of our variant if it is the closest to our
+        target CR we have seen.  Returns True if it was.
+        """
+
+        # Distance, if we weren't given it
+        if distance is None:
+            distance = self.get_distance(variant_cr)
+
+        # Closer?
+        if self._best is None or distance < self._best[0]:
+            self._best = (
+                distance, variant_cr,
+                self._variant_monster.get_variant_state()
+            )
+            return True
+
+        # Nope
+        return False
+
+
+class MonsterVariantBatch():
+    """
+    A batch of variants of one monster, made across a process pool.
+    Results come back in the order they finish, not the order they were
+    started.  Variant i is seeded with get_variant_seed(seed, i), so each
+    can be rebuilt from its key however many workers we use.
+    """
+
+    # Duplicates, or variants that didn't converge, in a row before a
+    # unique batch decides it has found every variant there is.
+    DUPLICATE_LIMIT = 200
+
+    def __init__(
+        self, monster, count, weapons, armor, traits, spells, workers=None,
+        search=VariantSearchEnum.RANDOM, max_iterations=None, deadline=None,
+        seed=None, unique=False, duplicate_limit=DUPLICATE_LIMIT,
+        records=False, target_cr=None, instrument=False,
+        solution_store=None
+    ):
+        """
+        Constructor!
+        A None count never stops, records yields MonsterVariantResult
+        records rather than results, so variant monsters never leave
+        our workers.  target_cr retargets every variant, see
+        MonsterVariant.retarget.  instrument keeps VariantStats of every
+        search, merged into our stats as we yield them.
+        solution_store is a SolutionStore, each worker starts with a copy
+        of it, and we add every matching variant we yield to it.
+        """
+
+        # Batch seed, if we weren't given one
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self._seed = seed
+
+        # Workers, defaults to all our cores
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+
+        # What each worker needs
+        self._init_args = (
+            monster, weapons, armor, traits, spells,
+            search, max_iterations, deadline, records, target_cr,
+            instrument, solution_store
+        )
+
+        # Solutions, and their key, for solution_store
+        self._solution_store = solution_store
+        if solution_store is not None:
+            self._solution_key = SolutionStore.get_key(
+                monster, weapons, armor, target_cr
+            )
+
+        # Vars
+        self._count = count
+        self._duplicate_limit = duplicate_limit
+        self._records = records
+        self._unique = unique
+
+        # Fingerprints of the variants we've yielded, when unique
+        self._fingerprints = set()
+
+        # Duplicates and, when unique, variants that didn't converge
+        # skipped, and did we run out of new variants?
+        self.duplicates = 0
+        self.unconverged = 0
+        self.exhausted = False
+
+        # Every search's VariantStats, if instrumenting
+        self.stats = None
+        if instrument:
+            self.stats = VariantStats()
+
+    def __iter__(self):
+        """
+        Yields each MonsterVariantResult, or its record
+        """
+
+        # Unique batches don't know how many they'll need to make.
+        limit = self._count
+        if self._unique:
+            limit = None
+        results = self.iter_results(limit)
+
+        # Vars
+        duplicate_streak = 0
+        yielded = 0
+
+        try:
+            for result in results:
+
+                # Stats, duplicates or not, they were searched for.
+                if self.stats is not None:
+                    self.stats.merge(result.stats)
+
+                # Keep it for next time.
+                if (
+                    self._solution_store is not None and result.converged and
+                    result.monster is not None
+                ):
+                    self._solution_store.add(
+                        self._solution_key, result.fingerprint,
+                        result.monster.get_variant_solution()
+                    )
+
+                # Didn't converge, or seen it?  Either way, nothing new.
+                if self._unique:
+                    fingerprint = result.fingerprint
+                    if (
+                        not result.converged or
+                        fingerprint in self._fingerprints
+                    ):
+
+                        # Too many in a row, we've likely seen them all.
+                        if result.converged:
+                            self.duplicates += 1
+                        else:
+                            self.unconverged += 1
+                        duplicate_streak += 1
+                        if duplicate_streak >= self._duplicate_limit:
+                            self.exhausted = True
+                            return
+                        continue
+
+                    # New!
+                    self._fingerprints.add(fingerprint)
+                    duplicate_streak = 0
+
+                # Yield it
+                if self._records:
+                    yield result.get_record()
+                else:
+                    yield result
+
+                # Are we done?
+                yielded += 1
+                if self._count is not None and yielded >= self._count:
+                    return
+
+        # Stop our workers
+        finally:
+            results.close()
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return (
+            f"Unique: {self.get_unique_count()} Duplicates: "
+            f"{self.duplicates} Exhausted: {self.exhausted}"
+        )
+
+    def get_unique_count(self):
+        """
+        How many distinct variants we've yielded.  When exhausted, this
+        is how many the monster has.
+        """
+
+        return len(self._fingerprints)
+
+    def iter_results(self, limit=None):
+        """
+        Yields results from our workers, limit of them or until closed.
+        """
+
+        # Task indices
+        indices = itertools.count()
+        if limit is not None:
+            indices = iter(range(limit))
+
+        # Single worker?  No need for a pool.
+        if self._workers <= 1:
+            _create_many_init(*self._init_args)
+            for i in indices:
+                yield _create_many_task(get_variant_seed(self._seed, i))
+            return
+
+        # We keep a few tasks queued per worker, so results stream back
+        # without us holding every pending future at once.
+        window = self._workers * 4
+
+        # Let's GOOooo
+        executor = ProcessPoolExecutor(
+            max_workers=self._workers, initializer=_create_many_init,
+            initargs=self._init_args
+        )
+        try:
+
+            # Tasks in flight
+            pending = set()
+
+            # Until we've got them all
+            while True:
+
+                # Top up
+                for i in itertools.islice(indices, window - len(pending)):
+                    pending.add(executor.submit(
+                        _create_many_task, get_variant_seed(self._seed, i)
+                    ))
+
+                # All done?
+                if not pending:
+                    return
+
+                # Yield what finished
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        # Stopped early?  Don't wait on what's still queued.
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+class MonsterVariantLadder():
+    """
+    One variant of a monster at every CR, made across a process pool.
+    The monster's CR plan, eligible equipment and LeverCurves are worked
+    out once, here, and shared by every rung.  CRs no variant can reach
+    are skipped, see unreachable.  Rungs come back in the order they
+    finish.  The rung at row i is seeded with get_variant_seed(seed, i).
+    """
+
+    # Iterations each rung gets, when we aren't given a budget
+    RUNG_ITERATIONS = 2000
+
+    def __init__(
+        self, monster, weapons, armor, traits, spells, workers=None,
+        search=VariantSearchEnum.GUIDED, max_iterations=None, deadline=None,
+        seed=None, records=False, instrument=False
+    ):
+        """
+        Constructor!
+        records yields MonsterVariantResult records rather than results.
+        instrument keeps VariantStats of every rung, merged into our
+        stats as we yield them.
+        """
+
+        # A budget, so rungs that can't converge still finish.
+        if max_iterations is None and deadline is None:
+            max_iterations = self.RUNG_ITERATIONS
+
+        # Ladder seed, if we weren't given one
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self._seed = seed
+
+        # Workers, defaults to all our cores
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+
+        # Shared work.  The plan and eligible equipment are cached on
+        # monster, so go along with it to our workers.
+        monster.get_cr()
+        monster.get_eligible_armor(armor)
+        monster.get_eligible_weapons(weapons)
+        lever_curves = LeverCurves(
+            monster, *get_lever_maximums(
+                monster, MonsterVariant.MAXIMUM_HIT_DICE,
+                MonsterVariant.MAXIMUM_ATTACKS_PER_ROUND
+            )
+        )
+
+        # What each worker needs
+        self._init_args = (
+            monster, weapons, armor, traits, spells, lever_curves,
+            search, max_iterations, deadline, records, instrument
+        )
+
+        # Rungs, a seed and CR for each row, and the CRs we skip as no
+        # variant can reach them.
+        self._rungs = []
+        self.unreachable = []
+        for row, stats in enumerate(MONSTER_STATS_BY_CR):
+            rung = (
+                get_variant_seed(self._seed, row),
+                stats[MonsterStatsByCrEnum.CR]
+            )
+            try:
+                MonsterVariant(
+                    monster, weapons, armor, traits, spells, seed=rung[0],
+                    target_cr=rung[1], lever_curves=lever_curves
+                ).check_reachable()
+            except ValueError:
+                self.unreachable.append(rung[1])
+                continue
+            self._rungs.append(rung)
+
+        # Every rung's VariantStats, if instrumenting
+        self.stats = None
+        if instrument:
+            self.stats = VariantStats()
+
+    def __iter__(self):
+        """
+        Yields each rung's MonsterVariantResult, or its record
+        """
+
+        # Single worker?  No need for a pool.
+        if self._workers <= 1:
+            _create_ladder_init(*self._init_args)
+            for rung in self._rungs:
+                yield self.get_yielded(_create_ladder_task(*rung))
+            return
+
+        # Let's GOOooo
+        executor = ProcessPoolExecutor(
+            max_workers=self._workers, initializer=_create_ladder_init,
+            initargs=self._init_args
+        )
+        try:
+            futures = [
+                executor.submit(_create_ladder_task, *rung)
+                for rung in self._rungs
+            ]
+            for future in as_completed(futures):
+                yield self.get_yielded(future.result())
+
+        # Stopped early?  Don't wait on what's still queued.
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def get_yielded(self, result):
+        """
+        Merges result's stats into ours, returning it to yield.
+        """
+
+        if self.stats is not None:
+            self.stats.merge(result.stats)
+        return result
+
+
+class MonsterVariantRace():
+    """
+    Races independently seeded searches for one variant at a time across
+    a process pool.  The first to converge wins, the rest are told to
+    stop.  Searches are heavy-tailed, so the fastest of a few is far
+    more predictable than any one.  The racer i of run r is seeded with
+    get_variant_seed(get_variant_seed(seed, r), i).  Close it, or use it
+    with a with, when done.
+    """
+
+    def __init__(
+        self, monster, weapons, armor, traits, spells, racers=None,
+        workers=None, search=VariantSearchEnum.RANDOM, max_iterations=None,
+        deadline=None, seed=None, restart_unit=None, target_cr=None
+    ):
+        """
+        Constructor!
+        racers defaults to our workers, which default to all our cores.
+        restart_unit restarts each racer on a Luby schedule, see
+        MonsterVariant.create_restarting.
+        """
+
+        # Race seed, if we weren't given one
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self._seed = seed
+
+        # Workers and racers, defaults to all our cores
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if racers is None:
+            racers = workers
+        self._racers = racers
+        self._workers = workers
+
+        # Vars
+        self._runs = 0
+
+        # Winners' iterations, see get_percentiles
+        self.iterations = []
+
+        # What each racer needs
+        init_args = (
+            monster, weapons, armor, traits, spells, target_cr, search,
+            max_iterations, deadline, restart_unit
+        )
+
+        # Single worker?  No need for a pool, racers run one at a time.
+        self._executor = None
+        self._manager = None
+        if workers <= 1:
+            _create_race_init(*init_args, None)
+            return
+
+        # Our pool, and how we tell it to stop.
+        self._manager = Manager()
+        self._stop_event = self._manager.Event()
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_create_race_init,
+            initargs=init_args + (self._stop_event,)
+        )
+
+    def __enter__(self):
+        """
+        With!
+        """
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        With done!
+        """
+
+        self.close()
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        percentiles = get_percentiles(self.iterations)
+        return (
+            f"Runs: {self._runs} Racers: {self._racers} Iterations "
+            f"p50: {percentiles[50]} p99: {percentiles[99]}"
+        )
+
+    def close(self):
+        """
+        Shuts down our pool
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._manager.shutdown()
+            self._executor = None
+
+    def run(self):
+        """
+        Races for one variant, returning the winner's
+        MonsterVariantResult.  If none converge, the closest.
+        """
+
+        # Racers' seeds
+        seed = get_variant_seed(self._seed, self._runs)
+        seeds = [get_variant_seed(seed, i) for i in range(self._racers)]
+        self._runs += 1
+
+        # Single worker?  First to converge wins.
+        if self._executor is None:
+            winner = None
+            for racer_seed in seeds:
+                result = _create_race_task(racer_seed)
+                if winner is None or result.distance < winner.distance:
+                    winner = result
+                if winner.converged:
+                    break
+
+        # Race!
+        else:
+            self._stop_event.clear()
+            futures = [
+                self._executor.submit(_create_race_task, racer_seed)
+                for racer_seed in seeds
+            ]
+
+            # First past the post, or the closest.
+            winner = None
+            for future in as_completed(futures):
+                result = future.result()
+                if winner is None or result.distance < winner.distance:
+                    winner = result
+                if winner.converged:
+                    break
+
+            # Stop the rest, and wait for them so they don't run into
+            # our next race.
+            self._stop_event.set()
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+        # Return
+        self.iterations.append(winner.iterations)
+        return winner
+
+
+class MonsterVariantResult():
+    """
+    How a MonsterVariant.create went
+    """
+
+    def __init__(
+        self, converged, iterations, distance, cr, monster, key,
+        cr_cache_hits, cr_cache_misses, target_cr=None, stats=None,
+        tabu_rejections=0, warm_start=False
+    ):
+        """
+        Constructor!
+        """
+
+        # Did we start from a known solution?
+        self.warm_start = warm_start
+
+        # Proposals turned down for revisiting a recent state
+        self.tabu_rejections = tabu_rejections
+
+        # VariantStats of our search, if instrumented
+        self.stats = stats
+
+        # Key to rebuild us with MonsterVariant.from_key, along with our
+        # target CR if we were retargeted.  None if we can't be rebuilt.
+        self.key = key
+        self.target_cr = target_cr
+
+        # CRCache hits and misses during our search
+        self.cr_cache_hits = cr_cache_hits
+        self.cr_cache_misses = cr_cache_misses
+
+        # The Variant Monster, and its fingerprint
+        self.monster = monster
+        self.fingerprint = monster.get_fingerprint()
+
+        # Did we land on our base CR?
+        self.converged = converged
+
+        # Iterations we took
+        self.iterations = iterations
+
+        # CR rows we are off by, 0 when converged
+        self.distance = distance
+
+        # The CR we ended on
+        self.cr = cr
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return (
+            f"Converged: {self.converged} Iterations: {self.iterations} "
+            f"Distance: {self.distance} CR: {self.cr}"
+        )
+
+    def get_record(self):
+        """
+        A compact, JSON friendly record of us.  The key rebuilds the
+        variant with MonsterVariant.from_key.
+        """
+
+        record = {
+            "key": self.key,
+            "target_cr": self.target_cr,
+            "cr": self.cr,
+            "converged": self.converged,
+            "iterations": self.iterations,
+            "distance": self.distance
+        }
+
+        # Stats, if instrumented
+        if self.stats is not None:
+            record["stats"] = self.stats.get_dict()
+
+        # Return
+        return record
+
+
+def _create_ladder_init(
+    monster, weapons, armor, traits, spells, lever_curves, search,
+    max_iterations, deadline, records, instrument
+):
+    """
+    Sets up a create_ladder worker process.
+    """
+
+    # Store what our tasks need
+    _CREATE_LADDER["args"] = (monster, weapons, armor, traits, spells)
+    _CREATE_LADDER["instrument"] = instrument
+    _CREATE_LADDER["lever_curves"] = lever_curves
+    _CREATE_LADDER["create"] = (search, max_iterations, deadline)
+    _CREATE_LADDER["records"] = records
+
+    # Rungs all vary the same monster, so they share a CR cache.
+    _CREATE_LADDER["cr_cache"] = CRCache()
+
+
+def _create_ladder_task(seed, target_cr):
+    """
+    Creates a single rung in a create_ladder worker process.
+    """
+
+    variant = MonsterVariant(
+        *_CREATE_LADDER["args"], seed=seed,
+        cr_cache=_CREATE_LADDER["cr_cache"], target_cr=target_cr,
+        lever_curves=_CREATE_LADDER["lever_curves"],
+        instrument=_CREATE_LADDER["instrument"]
+    )
+    result = variant.create(*_CREATE_LADDER["create"])
+
+    # Only sending back the record?  Leave the monster here.
+    if _CREATE_LADDER["records"]:
+        result.monster = None
+    return result
+
+
+def _create_race_init(
+    monster, weapons, armor, traits, spells, target_cr, search,
+    max_iterations, deadline, restart_unit, stop_event
+):
+    """
+    Sets up a create_race worker process.
+    """
+
+    # Store what our racers need
+    _CREATE_RACE["args"] = (monster, weapons, armor, traits, spells)
+    _CREATE_RACE["create"] = (search, max_iterations, deadline, restart_unit)
+    _CREATE_RACE["stop_event"] = stop_event
+    _CREATE_RACE["target_cr"] = target_cr
+
+    # Racers all vary the same monster, so they share a CR cache.
+    _CREATE_RACE["cr_cache"] = CRCache()
+
+
+def _create_race_task(seed):
+    """
+    Runs a single racer in a create_race worker process.
+    """
+
+    variant = MonsterVariant(
+        *_CREATE_RACE["args"], seed=seed, cr_cache=_CREATE_RACE["cr_cache"],
+        target_cr=_CREATE_RACE["target_cr"],
+        stop_event=_CREATE_RACE["stop_event"]
+    )
+    return variant.create(*_CREATE_RACE["create"])
+
+
+def _create_many_init(
+    monster, weapons, armor, traits, spells, search, max_iterations, deadline,
+    records, target_cr, instrument, solution_store
+):
+    """
+    Sets up a create_many worker process.
+    """
+
+    # Store what our tasks need
+    _CREATE_MANY["args"] = (monster, weapons, armor, traits, spells)
+    _CREATE_MANY["instrument"] = instrument
+    _CREATE_MANY["solution_store"] = solution_store
+    _CREATE_MANY["target_cr"] = target_cr
+    _CREATE_MANY["create"] = (search, max_iterations, deadline)
+    _CREATE_MANY["records"] = records
+
+    # Tasks all vary the same monster, so they share a CR cache.
+    _CREATE_MANY["cr_cache"] = CRCache()
+
+
+def _create_many_task(seed):
+    """
+    Creates a single variant in a create_many worker process.
+    """
+
+    variant = MonsterVariant(
+        *_CREATE_MANY["args"], seed=seed, cr_cache=_CREATE_MANY["cr_cache"],
+        target_cr=_CREATE_MANY["target_cr"],
+        instrument=_CREATE_MANY["instrument"],
+        solution_store=_CREATE_MANY["solution_store"]
+    )
+    result = variant.create(*_CREATE_MANY["create"])
+
+    # Only sending back the record?  Leave the monster here.
+    if _CREATE_MANY["records"]:
+        result.monster = None
+    return result
+
+
+def get_luby(index):
+    """
+    The index'th, from 1, of the Luby restart sequence;
+    1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...
+    """
+
+    # Smallest k where 2^k - 1 reaches index
+    k = 1
+    while (1 << k) - 1 < index:
+        k += 1
+
+    # End of a run?  Otherwise, it repeats what came before.
+    if index == (1 << k) - 1:
+        return 1 << (k - 1)
+    return get_luby(index - (1 << (k - 1)) + 1)
+
+
+def get_percentiles(values, percentiles=(50, 99)):
+    """
+    Nearest rank percentiles of values, as a dict of percentile to
+    value.  None when there are no values.
+    """
+
+    values = sorted(values)
+    return {
+        percentile: (
+            values[max(math.ceil(percentile / 100 * len(values)) - 1, 0)]
+            if values else None
+        )
+        for percentile in percentiles
+    }
+
+
+def get_variant_seed(seed, index):
+    """
+    Seed for the index'th variant of a batch.  Hashing the pair keeps each
+    variant's stream independent of its neighbours.
+    """
+
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+def iter_variants(
+    monster, weapons, armor, traits, spells, count=None, records=False,
+    workers=None, search=VariantSearchEnum.RANDOM, max_iterations=None,
+    deadline=None, seed=None, target_cr=None, instrument=False,
+    solution_store=None
+):
+    """
+    Yields variants of monster as each finishes, forever unless given a
+    count.  With records, yields MonsterVariantResult.get_record dicts
+    instead of results, with instrument, their stats.  Nothing is held
+    on to once yielded, so memory stays flat however many we make.
+    """
+
+    yield from MonsterVariantBatch(
+        monster, count, weapons, armor, traits, spells, workers, search,
+        max_iterations, deadline, seed, records=records, target_cr=target_cr,
+        instrument=instrument, solution_store=solution_store
+    )
+
 
 # We gotta be included!
 if __name__ == '__main__':
@@ -77,6 +77,18 @@ CR["SPELLCASTING"] = 0.5
 CR["TRAITS"] = 0.05  # 0.25
 
 
+def get_cr_settings_fingerprint():
+    """
+    Fingerprint of CR as it is now, for caches of anything worked out
+    from it.  Changes whenever a CR setting does.
+    """
+
+    return tuple(
+        (key, tuple(value.items()) if isinstance(value, dict) else value)
+        for key, value in CR.items()
+    )
+
+
 # We gotta be included!
 if __name__ == '__main__':
     pass
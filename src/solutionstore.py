@@ -0,0 +1,129 @@
+"""
+
+    solutionstore.py
+
+    Variants we found before are a good place to start looking for new
+    ones.  A SolutionStore keeps the solutions, see
+    Monster.get_variant_solution, that matched for each base monster and
+    search settings, and can be saved between runs.
+
+"""
+
+# Sys
+import hashlib
+import os
+import pickle
+
+# Meeeaaaine
+from .settings import CR
+
+
+__all__ = ["SolutionStore"]
+
+
+class SolutionStore():
+    """
+    Known good variant solutions, by base monster and settings hash
+    """
+
+    # Most solutions we keep for each key
+    MAXIMUM_SIZE = 1000
+
+    def __init__(self, path=None, maximum_size=MAXIMUM_SIZE):
+        """
+        Constructor!
+        Given a path, loads what was saved there, if anything.
+        """
+
+        # Key -> {fingerprint: solution}, and a list to pick from.
+        self._solutions = {}
+        self._solution_lists = {}
+
+        # Vars
+        self._maximum_size = maximum_size
+        self._path = path
+
+        # Saved?
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        """
+        How many solutions we hold, all keys
+        """
+
+        return sum(len(solutions) for solutions in self._solutions.values())
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return f"Keys: {len(self._solutions)} Solutions: {len(self)}"
+
+    def add(self, key, fingerprint, solution):
+        """
+        Keeps a solution under key, by its Monster.get_fingerprint.
+        Returns False if we already have it, or are full.
+        """
+
+        # Have it, or full?
+        solutions = self._solutions.setdefault(key, {})
+        if (
+            fingerprint in solutions or
+            len(solutions) >= self._maximum_size
+        ):
+            return False
+
+        # Keep it
+        solutions[fingerprint] = solution
+        self._solution_lists.setdefault(key, []).append(solution)
+        return True
+
+    def get(self, key, rng):
+        """
+        A random solution under key, from rng's stream.  None if we don't
+        have any.
+        """
+
+        if not self._solution_lists.get(key):
+            return None
+        return rng.choice(self._solution_lists[key])
+
+    @staticmethod
+    def get_key(monster, weapons, armor, target_cr=None):
+        """
+        Key for a base monster and search settings; what the monster
+        is, the catalogs, the target CR and settings.CR.  Stable between
+        runs, unlike hash().
+        """
+
+        settings = repr((
+            monster.get_cr_fingerprint(), sorted(weapons), sorted(armor),
+            target_cr, sorted(CR.items())
+        ))
+        return hashlib.sha1(settings.encode()).hexdigest()
+
+    def load(self, path):
+        """
+        Adds the solutions saved at path
+        """
+
+        with open(path, "rb") as solutions_file:
+            saved = pickle.load(solutions_file)
+        for key, solutions in saved.items():
+            for fingerprint, solution in solutions.items():
+                self.add(key, fingerprint, solution)
+
+    def save(self, path=None):
+        """
+        Saves our solutions to path, or the path we were made with.
+        """
+
+        with open(path or self._path, "wb") as solutions_file:
+            pickle.dump(self._solutions, solutions_file)
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
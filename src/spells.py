@@ -6,6 +6,9 @@
 
 """
 
+# Sys
+from copy import copy
+
 # mmmiiiNNEee
 from .enumerators import ExtrasEnum, SpellsEnum
 
@@ -57,6 +60,20 @@ class Spells():
         else:
             return False
 
+    def copy_with_stats(self, stats):
+        """
+        Copies us and our spell lists onto another stats instance, sharing
+        the spell data table.
+        """
+
+        spells = copy(self)
+        spells._stats = stats
+        spells._spell_dict = {
+            spell_level: list(spell_list)
+            for spell_level, spell_list in self._spell_dict.items()
+        }
+        return spells
+
     def get_cantrips(self):
         """
         Gets our cantrips
@@ -0,0 +1,88 @@
+"""
+
+    tabulist.py
+
+    Swapping a weapon or armor out and back in lands a variant search
+    right where it just was.  A TabuList remembers the most recent
+    states by fingerprint, so we can turn them down before working out
+    their CR again.
+
+"""
+
+# Sys
+from collections import deque
+
+
+__all__ = ["TabuList"]
+
+
+class TabuList():
+    """
+    The maximum_size most recent fingerprints, oldest dropped first
+    """
+
+    def __init__(self, maximum_size):
+        """
+        Constructor!
+        """
+
+        # Order we saw them, and fast lookups
+        self._fingerprints = set()
+        self._queue = deque()
+        self._maximum_size = maximum_size
+
+        # How many we turned down, and how many in a row
+        self.rejected = 0
+        self.streak = 0
+
+    def __contains__(self, fingerprint):
+        """
+        Have we seen it recently?
+        """
+
+        return fingerprint in self._fingerprints
+
+    def __len__(self):
+        """
+        How many we remember
+        """
+
+        return len(self._queue)
+
+    def add(self, fingerprint):
+        """
+        Remembers fingerprint, unless we already do.  Returns False,
+        counting a rejection, if we did.
+        """
+
+        # Seen it?
+        if fingerprint in self._fingerprints:
+            self.rejected += 1
+            self.streak += 1
+            return False
+
+        # Nope, remember it.
+        self.streak = 0
+        self._fingerprints.add(fingerprint)
+        self._queue.append(fingerprint)
+
+        # Too many?  Forget the oldest.
+        if len(self._queue) > self._maximum_size:
+            self._fingerprints.discard(self._queue.popleft())
+
+        # Return
+        return True
+
+    def clear(self):
+        """
+        Forgets everything, but how many we turned down
+        """
+
+        self._fingerprints.clear()
+        self._queue.clear()
+        self.streak = 0
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
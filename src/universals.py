@@ -8,8 +8,10 @@
 
 # Sys
 import ast
+from contextlib import contextmanager
 import json
 import os
+import random
 
 # Moinee
 from .Dice.src.dice import Dice
@@ -247,6 +249,32 @@ def range_dict_from_list(list_to_convert):
     return rd
 
 
+@contextmanager
+def seeded_random(rng):
+    """
+    Runs the with block on rng's stream, for code that uses the global
+    random module we can't hand a Random to (Dice, BalancedStats).
+    rng picks up where the block left off, and the global random state
+    is put back afterwards.  A None rng leaves the global random be.
+    """
+
+    # Nothing to swap?
+    if rng is None:
+        yield
+        return
+
+    # Swap rng's state in
+    global_state = random.getstate()
+    random.setstate(rng.getstate())
+
+    # Run, then swap back out
+    try:
+        yield
+    finally:
+        rng.setstate(random.getstate())
+        random.setstate(global_state)
+
+
 def spaced_list(list, spacer='\n', include_at_end=False):
     """
     Given a list and a spacer '\n', ', '... etc, returns that list formated.
@@ -0,0 +1,253 @@
+"""
+
+    variantbounds.py
+
+    Before searching for a variant, we work out the lowest and highest
+    DEFENSE, OFFENSE and CR rows any variant of a monster could land on.
+    Targets outside of those can't be reached, however long we search.
+
+    Stats are rebalanced from the monster's lowest stat, so each stat sits
+    somewhere between that and what's left when the rest are at their
+    lowest.  We treat every stat as free within those bounds, and every
+    eligible weapon and armor, along with the weapons we start with, as
+    available, so the bounds are loose but never tighter than what is
+    possible.  Hit dice and attacks per round stay as the monster has
+    them, unless we are given a range for each.  HP and DPR only go one
+    way with them, so the ends of a range are all we need to try.
+
+"""
+
+# Sys
+from collections import OrderedDict
+import itertools
+import math
+
+# Meeeaaaine
+from .Dice.src.dice import Dice
+from .challengerating import clip_cr_row, cr_defense, cr_offense
+from .enumerators import ArmorEnum, MonsterPropertiesEnum, StatsEnum
+from .settings import get_cr_settings_fingerprint
+
+
+__all__ = ["MAXIMUM_STAT", "get_reachable_bounds", "get_stat_bonus"]
+
+
+# Highest a stat can go
+MAXIMUM_STAT = 30
+
+# Bounds we've already worked out, by base monster, eligible equipment,
+# levers and settings.CR, least recently used first.
+BOUNDS_CACHE = OrderedDict()
+
+# Most bounds we hold on to
+BOUNDS_CACHE_SIZE = 1024
+
+
+def get_armor_sets(monster, eligible_armor):
+    """
+    Every set of armor a variant could wear, at most one per slot.
+    """
+
+    # Stuck with what we've got?
+    if monster.has_monster_property(MonsterPropertiesEnum.NO_VARIANT_ARMOR):
+        return [list(monster._armors._armor_list)]
+
+    # Armor by Slot, None being an empty slot
+    slots = {}
+    for armor in eligible_armor.values():
+        slots.setdefault(armor._data[ArmorEnum.SLOT], [None]).append(armor)
+
+    # One from each slot
+    return [
+        [armor for armor in armor_set if armor is not None]
+        for armor_set in itertools.product(*slots.values())
+    ]
+
+
+def get_bonus_range(monster):
+    """
+    Every stat bonus a stat of a variant of monster could have.
+    """
+
+    # Stats are rebalanced up from our lowest
+    stat_list = monster._base_stat_list
+    lowest = min(stat_list)
+    highest = min(
+        MAXIMUM_STAT, sum(stat_list) - lowest * (len(stat_list) - 1)
+    )
+
+    # Return
+    return range(get_stat_bonus(lowest), get_stat_bonus(highest) + 1)
+
+
+def get_defense_bounds(monster, eligible_armor, bonus_range, hit_dice_counts):
+    """
+    Lowest and highest DEFENSE rows, over CON, DEX, armor and
+    hit_dice_counts.
+    """
+
+    # Vars
+    armor_sets = get_armor_sets(monster, eligible_armor)
+    rows = []
+
+    # Try them all
+    for hit_dice_count in hit_dice_counts:
+        hp_average = math.ceil(
+            Dice(monster._hit_dice_size, hit_dice_count).get_average()
+        )
+        for con_bonus, dex_bonus in itertools.product(bonus_range, repeat=2):
+            hp = max(1, hp_average + con_bonus * hit_dice_count)
+            for armor_set in armor_sets:
+                rows.append(cr_defense(
+                    hp, monster._armors.get_ac_from(armor_set, dex_bonus)
+                ))
+
+    # Return
+    return min(rows), max(rows)
+
+
+def get_offense_bounds(
+    monster, eligible_weapons, bonus_range, attacks_per_round
+):
+    """
+    Lowest and highest OFFENSE rows, over STR, DEX, spell stats,
+    weapons, eligible or ones we started with, and attacks_per_round.
+    """
+
+    # Weapon sets to try.  Holding just one gives the lowest, holding
+    # the best of everything the highest.  What we start with, natural and
+    # NO_ADD weapons included, we can keep.
+    if monster.has_monster_property(MonsterPropertiesEnum.NO_VARIANT_WEAPON):
+        weapon_sets = [list(monster._weapons._weapon_list)]
+    else:
+        weapons = (
+            list(eligible_weapons.values()) +
+            list(monster._weapons._weapon_list)
+        )
+        weapon_sets = [[weapon] for weapon in weapons]
+        weapon_sets.append(weapons)
+
+        # Started with nothing?  We can still be holding nothing.
+        if not monster._weapons._weapon_list:
+            weapon_sets.append([])
+
+    # Casters, and the stats they cast with
+    casters = []
+    if monster.is_spell_caster():
+        casters.append(monster._spells)
+    if monster.is_innate_caster():
+        casters.append(monster.innate)
+
+    # Stats we vary
+    stats = [StatsEnum.STRENGTH, StatsEnum.DEXTERITY]
+    for caster in casters:
+        if caster.get_stat() not in stats:
+            stats.append(caster.get_stat())
+
+    # Try them all
+    rows = []
+    prof_bonus = monster.get_prof_bonus()
+    for bonus_list in itertools.product(bonus_range, repeat=len(stats)):
+        bonuses = dict(zip(stats, bonus_list))
+        for weapon_set, attacks in itertools.product(
+            weapon_sets, attacks_per_round
+        ):
+
+            # Weapons, as Weapons.get_dpr_max/get_to_hit_max
+            damage_per_round = 0
+            to_hit = 0
+            for weapon in weapon_set:
+                stat_bonus = weapon.get_stat_bonus_from(
+                    bonuses[StatsEnum.STRENGTH], bonuses[StatsEnum.DEXTERITY]
+                )
+                damage_per_round = max(
+                    weapon._dice.get_average() + stat_bonus, damage_per_round
+                )
+                to_hit = max(stat_bonus, to_hit)
+            damage_per_round = damage_per_round * attacks
+            to_hit = to_hit + prof_bonus
+
+            # Spells, as Monster.get_cr_offense
+            spell_dc = 8
+            for caster in casters:
+                caster_to_hit = (
+                    caster._prof_bonus + bonuses[caster.get_stat()]
+                )
+                spell_dc = max(8 + caster_to_hit, spell_dc)
+                damage_per_round = max(
+                    caster.get_max_dpr(monster._expected_cr),
+                    damage_per_round
+                )
+                to_hit = max(caster_to_hit, to_hit)
+
+            # Row!
+            rows.append(cr_offense(damage_per_round, to_hit, spell_dc))
+
+    # Return
+    return min(rows), max(rows)
+
+
+def get_reachable_bounds(
+    monster, eligible_weapons, eligible_armor, hit_dice_counts=None,
+    attacks_per_round=None
+):
+    """
+    Lowest and highest rows a variant of monster can reach, as a dict
+    of DEFENSE, OFFENSE and CR to (lowest, highest).  hit_dice_counts
+    and attacks_per_round are (lowest, highest) a variant can pull each
+    lever to, by default as monster has them.
+    """
+
+    # Levers
+    if hit_dice_counts is None:
+        hit_dice_counts = (monster._hit_dice_count,)
+    if attacks_per_round is None:
+        attacks_per_round = (monster._attacks_per_round,)
+
+    # Worked it out already?
+    key = (
+        monster.get_cr_fingerprint(), tuple(eligible_weapons),
+        tuple(eligible_armor), tuple(hit_dice_counts),
+        tuple(attacks_per_round), get_cr_settings_fingerprint()
+    )
+    if key in BOUNDS_CACHE:
+        BOUNDS_CACHE.move_to_end(key)
+        return BOUNDS_CACHE[key]
+
+    # DEFENSE/OFFENSE
+    bonus_range = get_bonus_range(monster)
+    defense = get_defense_bounds(
+        monster, eligible_armor, bonus_range, hit_dice_counts
+    )
+    offense = get_offense_bounds(
+        monster, eligible_weapons, bonus_range, attacks_per_round
+    )
+
+    # CR rows, built as Monster.get_cr does from the rows and our plan.
+    _, cr_settings_sum = monster.get_cr_cached("PLAN", monster.get_cr_plan)
+    cr = tuple(
+        clip_cr_row(math.floor((d + o) / 2 + cr_settings_sum))
+        for d, o in zip(defense, offense)
+    )
+
+    # Store, dropping the least recently used if we hold too many.
+    bounds = {"DEFENSE": defense, "OFFENSE": offense, "CR": cr}
+    BOUNDS_CACHE[key] = bounds
+    if len(BOUNDS_CACHE) > BOUNDS_CACHE_SIZE:
+        BOUNDS_CACHE.popitem(last=False)
+
+    # Return
+    return bounds
+
+
+def get_stat_bonus(stat):
+    """
+    Stat Bonus for a stat value
+    """
+
+    return (stat - 10) // 2
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,400 @@
+"""
+
+    variantspace.py
+
+    Some monsters only have a handful of stat lines, weapon sets and armor
+    sets to choose from.  For those, rather than searching, we enumerate
+    the variants once, keep the ones that land on the base CR, and pick
+    from them.  Stat lines are sampled rather than listed, see
+    VariantSpace, so picks are from the matches we found.
+
+"""
+
+# Sys
+from bisect import bisect_right
+from collections import OrderedDict
+import random
+
+# Meeeaaaine
+from .crcache import CRCache
+from .enumerators import ExtrasEnum, MonsterPropertiesEnum, StatsEnum
+from .settings import get_cr_settings_fingerprint
+
+
+__all__ = ["VariantSpace", "get_variant_space"]
+
+
+# Variant spaces we've already enumerated, by base monster, catalogs and
+# settings.CR, least recently used first.
+VARIANT_SPACES = OrderedDict()
+
+# Most variant spaces we hold on to, each can hold many matches.
+VARIANT_SPACES_SIZE = 16
+
+
+class VariantSpace():
+    """
+    The variants of a monster we found, and which of them match its CR.
+    Stat lines come from BalancedStats, which we can't list, so we
+    rebalance until STAT_SATURATION in a row turn up nothing new; lines
+    that rarely turn up may be missed.  Lines that only differ in ways a
+    CR can't see count once, see get_stat_key.  Equipment is every legal
+    set of the eligible weapons and armor.
+    """
+
+    # Most variants we are willing to enumerate
+    MAXIMUM_SIZE = 100000
+
+    # Rebalances in a row without a new stat line before we call it done
+    STAT_SATURATION = 500
+
+    # Seed we discover stat lines with, so every process finds the same
+    STAT_SEED = 0
+
+    def __init__(
+        self, monster, weapons, armor, cr_cache=None,
+        maximum_size=MAXIMUM_SIZE, is_over_budget=None
+    ):
+        """
+        Constructor!
+        Raises a ValueError if monster has more than maximum_size variants.
+        is_over_budget is asked before each stat line and variant we try,
+        when it says so we stop where we are, see complete.
+        """
+
+        # Have we tried everything?
+        self.complete = True
+        self._is_over_budget = is_over_budget
+
+        # CRs of states we've seen
+        if cr_cache is None:
+            cr_cache = CRCache()
+        self._cr_cache = cr_cache
+
+        # Vars
+        self._maximum_size = maximum_size
+        self._name = monster._name
+        self._size = 0
+
+        # What we match against, and a copy to try variants on.
+        self._base_monster_cr = monster.get_cr()
+        self._monster = monster.get_variant_copy()
+
+        # Equipment we could ever use
+        self._eligible_armor = monster.get_eligible_armor(armor)
+        self._eligible_weapons = monster.get_eligible_weapons(weapons)
+
+        # Lowest stat, which we rebalance from
+        self._lowest_base_stat = monster._stats.get_stat(
+            monster._stats.get_lowest_stat()
+        )
+
+        # Stats a CR can see; STR/DEX for weapons and AC, CON for HP, and
+        # whatever we cast with.
+        self._cr_stats = [
+            StatsEnum.STRENGTH, StatsEnum.DEXTERITY, StatsEnum.CONSTITUTION
+        ]
+        casters = []
+        if monster.is_spell_caster():
+            casters.append(monster._spells)
+        if monster.is_innate_caster():
+            casters.append(monster.innate)
+        for caster in casters:
+            if caster.get_stat() not in self._cr_stats:
+                self._cr_stats.append(caster.get_stat())
+
+        # STR requirements of armor we could wear, sorted
+        self._strength_requirements = sorted({
+            armor.get_extra(ExtrasEnum.STRENGTH_REQUIREMENT)
+            for armor in self._eligible_armor.values()
+            if armor.has_extra(ExtrasEnum.STRENGTH_REQUIREMENT)
+        })
+
+        # Enumerate!
+        self._matches = self.get_matches()
+
+    def __len__(self):
+        """
+        How many variants match our CR
+        """
+
+        return len(self._matches)
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        return f"{self._name} Variants: {self._size} Matches: {len(self)}"
+
+    def add_armor_sets(self, armor_set, start, compounds, armor_sets):
+        """
+        Adds every legal armor set that extends armor_set, using the
+        compounds from start on, to armor_sets.
+        """
+
+        # What we're wearing so far
+        armor_list = list(self._monster._armors._armor_list)
+
+        # Try each one on
+        for i in range(start, len(compounds)):
+            if self._monster.can_add_armor(self._eligible_armor[compounds[i]]):
+                self._monster.add_armor(compounds[i])
+                armor_sets.append(armor_set + (compounds[i],))
+                self.add_armor_sets(
+                    armor_set + (compounds[i],), i + 1, compounds, armor_sets
+                )
+                self._monster.set_armor(armor_list)
+
+    def add_weapon_sets(self, weapon_set, start, compounds, weapon_sets):
+        """
+        Adds every legal weapon set that extends weapon_set, using the
+        compounds from start on, to weapon_sets.  We start again from the
+        same compound, THROWN weapons can be held more than once.
+        """
+
+        # What we're holding so far
+        weapon_list = list(self._monster._weapons._weapon_list)
+
+        # Try each one out
+        for i in range(start, len(compounds)):
+            if self._monster.can_add_weapon(
+                self._eligible_weapons[compounds[i]]
+            ):
+                self._monster.add_weapon(compounds[i])
+                weapon_sets.append(weapon_set + (compounds[i],))
+                self.add_weapon_sets(
+                    weapon_set + (compounds[i],), i, compounds, weapon_sets
+                )
+                self._monster.set_weapons(weapon_list)
+
+    def get_armor_sets(self):
+        """
+        Every armor set our monster can wear with its current stats,
+        None if it can't change armor.
+        """
+
+        # Stuck with what we've got?
+        if self._monster.has_monster_property(
+            MonsterPropertiesEnum.NO_VARIANT_ARMOR
+        ):
+            return [None]
+
+        # Nothing on is fine too.
+        self._monster.set_armor([])
+        armor_sets = [()]
+        self.add_armor_sets((), 0, list(self._eligible_armor), armor_sets)
+        return armor_sets
+
+    def get_match(self, rng):
+        """
+        A random matching variant, from rng's stream.  None if nothing
+        matches.
+        """
+
+        if not self._matches:
+            return None
+        return rng.choice(self._matches)
+
+    def get_matches(self):
+        """
+        Tries every variant, returning those that land on our base CR as
+        (stats, weapon set, armor set).
+        """
+
+        # Stat lines, and the weapon sets we can pair with them.
+        stat_lines = self.get_stat_lines()
+        weapon_sets = self.get_weapon_sets()
+
+        # Armor can have a STR requirement, so depends on the stat line.
+        armor_sets_by_strength = {}
+        for stats in stat_lines:
+            self.set_candidate(self._monster, (stats, None, None))
+            _, strength = self.get_stat_key()
+            if strength not in armor_sets_by_strength:
+                armor_sets_by_strength[strength] = self.get_armor_sets()
+
+            # Too many?
+            self._size += (
+                len(weapon_sets) * len(armor_sets_by_strength[strength])
+            )
+            if self._size > self._maximum_size:
+                raise ValueError(
+                    f"{self._name} has more than {self._maximum_size} "
+                    f"variants, too many to enumerate"
+                )
+
+        # Try them all
+        matches = []
+        for stats in stat_lines:
+            self.set_candidate(self._monster, (stats, None, None))
+            _, strength = self.get_stat_key()
+            for weapon_set in weapon_sets:
+                for armor_set in armor_sets_by_strength[strength]:
+
+                    # Out of budget?  What we've found will do.
+                    if self.is_over_budget():
+                        return matches
+
+                    candidate = (stats, weapon_set, armor_set)
+                    self.set_candidate(self._monster, candidate)
+                    if (
+                        self._cr_cache.get_cr(self._monster) ==
+                        self._base_monster_cr
+                    ):
+                        matches.append(candidate)
+
+        # Return
+        return matches
+
+    def get_stat_key(self):
+        """
+        What of our monster's stat line a CR can see; the bonuses of the
+        stats it reads, and how many of our armor STR requirements it
+        meets.
+        """
+
+        strength = self._monster._stats.get_stat(StatsEnum.STRENGTH)
+        return (
+            tuple(
+                self._monster._stats.get_stat_bonus(stat.value)
+                for stat in self._cr_stats
+            ),
+            bisect_right(self._strength_requirements, strength)
+        )
+
+    def get_stat_lines(self):
+        """
+        Every stat line rebalancing gives us, one per get_stat_key, as
+        get_variant_state stats.
+        """
+
+        # Vars
+        rng = random.Random(self.STAT_SEED)
+        stat_lines = {}
+        streak = 0
+
+        # Until nothing new turns up, or we run out of budget
+        while streak < self.STAT_SATURATION and not self.is_over_budget():
+            self._monster.rebalance_stats(self._lowest_base_stat, rng)
+            stat_line = self.get_stat_key()
+
+            # Seen it?
+            if stat_line in stat_lines:
+                streak += 1
+                continue
+
+            # New!
+            stat_lines[stat_line] = self._monster.get_variant_state()[0]
+            streak = 0
+
+            # Too many?
+            if len(stat_lines) > self._maximum_size:
+                raise ValueError(
+                    f"{self._name} has more than {self._maximum_size} "
+                    f"stat lines, too many to enumerate"
+                )
+
+        # Return
+        return list(stat_lines.values())
+
+    def get_weapon_sets(self):
+        """
+        Every weapon set our monster can hold, at most three, None if it
+        can't change weapons.
+        """
+
+        # Stuck with what we've got?
+        if self._monster.has_monster_property(
+            MonsterPropertiesEnum.NO_VARIANT_WEAPON
+        ):
+            return [None]
+
+        # Started with nothing?  We can still be holding nothing.
+        weapon_list = list(self._monster._weapons._weapon_list)
+        weapon_sets = []
+        if not weapon_list:
+            weapon_sets.append(())
+
+        # Everything else
+        self._monster.set_weapons([])
+        self.add_weapon_sets((), 0, list(self._eligible_weapons), weapon_sets)
+        self._monster.set_weapons(weapon_list)
+
+        # Nothing we can hold?  Keep what we've got.
+        if not weapon_sets:
+            weapon_sets.append(None)
+
+        # Return
+        return weapon_sets
+
+    def is_over_budget(self):
+        """
+        Should we stop enumerating?  Once we do, we aren't complete.
+        """
+
+        if self.complete and self._is_over_budget is not None:
+            self.complete = not self._is_over_budget()
+        return not self.complete
+
+    def set_candidate(self, monster, candidate):
+        """
+        Puts a (stats, weapon set, armor set) candidate on monster.  None
+        sets leave what monster has.  Doesn't touch our HP.
+        """
+
+        # Unpack
+        stats, weapon_set, armor_set = candidate
+
+        # Stats
+        monster.set_variant_state((
+            stats, monster._hp, monster._weapons._weapon_list,
+            monster._armors._armor_list, monster._hit_dice_count,
+            monster._attacks_per_round
+        ))
+
+        # Equipment, made against monster's own stats
+        if weapon_set is not None:
+            monster.set_weapons([
+                monster._weapons.create(compound) for compound in weapon_set
+            ])
+        if armor_set is not None:
+            monster.set_armor([
+                monster._armors.create(compound) for compound in armor_set
+            ])
+
+
+def get_variant_space(
+    monster, weapons, armor, cr_cache=None, is_over_budget=None
+):
+    """
+    Gets monster's VariantSpace, enumerating it the first time we ask.
+    Spaces is_over_budget cut short are kept too, so we only ever pay
+    for enumerating once.
+    """
+
+    # Enumerated it already?
+    key = (
+        monster.get_cr_fingerprint(), tuple(weapons), tuple(armor),
+        get_cr_settings_fingerprint()
+    )
+    if key in VARIANT_SPACES:
+        VARIANT_SPACES.move_to_end(key)
+        return VARIANT_SPACES[key]
+
+    # Enumerate and Store, dropping the least recently used if we hold too
+    # many.
+    space = VariantSpace(
+        monster, weapons, armor, cr_cache, is_over_budget=is_over_budget
+    )
+    VARIANT_SPACES[key] = space
+    if len(VARIANT_SPACES) > VARIANT_SPACES_SIZE:
+        VARIANT_SPACES.popitem(last=False)
+
+    # Return
+    return space
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
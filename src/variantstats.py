@@ -0,0 +1,203 @@
+"""
+
+    variantstats.py
+
+    Where does a variant search spend its time?  VariantStats swaps a
+    variant's methods for timed ones while it searches, and counts how
+    its iterations went.  Nothing is swapped unless asked for, so it
+    costs nothing when off.
+
+"""
+
+# Sys
+from collections import Counter
+import json
+import time
+
+
+__all__ = ["VariantStats"]
+
+
+class TimedMethod():
+    """
+    A method that adds its calls and time to a VariantStats phase
+    """
+
+    def __init__(self, stats, phase, method):
+        """
+        Constructor!
+        """
+
+        self._method = method
+        self._phase = phase
+        self._stats = stats
+
+    def __call__(self, *args, **kwargs):
+        """
+        Calls our method, timing it
+        """
+
+        start = time.perf_counter()
+        try:
+            return self._method(*args, **kwargs)
+        finally:
+            self._stats.add_time(self._phase, time.perf_counter() - start)
+
+
+class VariantStats():
+    """
+    Per phase calls and time, iterations, acceptance and a histogram of
+    CR row distance per iteration, of one or more variant searches.
+    Phases nest, get_variant_cr's time includes get_cr's.
+    """
+
+    def __init__(self):
+        """
+        Constructor!
+        """
+
+        # Phase -> [calls, seconds]
+        self.phases = {}
+
+        # Iterations, and how many of the steps we tried we kept
+        self.iterations = 0
+        self.accepted = 0
+        self.proposed = 0
+
+        # CR row distance -> iterations that ended there
+        self.distances = Counter()
+
+        # Methods we've swapped, see instrument
+        self._instrumented = []
+
+    def __getstate__(self):
+        """
+        Pickle, without what we've swapped
+        """
+
+        state = dict(vars(self))
+        state["_instrumented"] = []
+        return state
+
+    def __str__(self):
+        """
+        To string!
+        """
+
+        phases = ", ".join(
+            f"{phase} {calls}/{seconds:.3f}s"
+            for phase, (calls, seconds) in sorted(self.phases.items())
+        )
+        return (
+            f"Iterations: {self.iterations} Acceptance: "
+            f"{self.get_acceptance_ratio():.2f} Phases: {phases}"
+        )
+
+    def add_iteration(self, distance, accepted):
+        """
+        Counts a step we tried, distance rows from our target, and if we
+        kept it.
+        """
+
+        self.distances[distance] += 1
+        self.proposed += 1
+        if accepted:
+            self.accepted += 1
+
+    def add_time(self, phase, seconds):
+        """
+        Adds a call, taking seconds, to phase
+        """
+
+        if phase not in self.phases:
+            self.phases[phase] = [0, 0]
+        self.phases[phase][0] += 1
+        self.phases[phase][1] += seconds
+
+    def get_acceptance_ratio(self):
+        """
+        Steps kept over steps tried, 0 when we haven't tried any.
+        """
+
+        if not self.proposed:
+            return 0
+        return self.accepted / self.proposed
+
+    def get_dict(self):
+        """
+        A JSON friendly dict of us
+        """
+
+        return {
+            "iterations": self.iterations,
+            "proposed": self.proposed,
+            "accepted": self.accepted,
+            "acceptance_ratio": self.get_acceptance_ratio(),
+            "phases": {
+                phase: {"calls": calls, "seconds": seconds}
+                for phase, (calls, seconds) in self.phases.items()
+            },
+            "distances": {
+                str(distance): count
+                for distance, count in sorted(self.distances.items())
+            }
+        }
+
+    def instrument(self, instance, phases):
+        """
+        Swaps each of instance's phases, method names, for a timed one
+        until release.
+        """
+
+        for phase in phases:
+            setattr(
+                instance, phase,
+                TimedMethod(self, phase, getattr(instance, phase))
+            )
+            self._instrumented.append((instance, phase))
+
+    def merge(self, stats):
+        """
+        Adds another VariantStats' counts to ours
+        """
+
+        # Phases
+        for phase, (calls, seconds) in stats.phases.items():
+            if phase not in self.phases:
+                self.phases[phase] = [0, 0]
+            self.phases[phase][0] += calls
+            self.phases[phase][1] += seconds
+
+        # Counts
+        self.iterations += stats.iterations
+        self.accepted += stats.accepted
+        self.proposed += stats.proposed
+        self.distances.update(stats.distances)
+
+    def release(self):
+        """
+        Puts back every method instrument swapped
+        """
+
+        for instance, phase in self._instrumented:
+            delattr(instance, phase)
+        self._instrumented = []
+
+    def time(self, phase, method, *args, **kwargs):
+        """
+        Calls method once, timing it as phase
+        """
+
+        return TimedMethod(self, phase, method)(*args, **kwargs)
+
+    def to_json(self, **kwargs):
+        """
+        Us, as JSON.  kwargs go to json.dumps.
+        """
+
+        return json.dumps(self.get_dict(), **kwargs)
+
+
+# We gotta be included!
+if __name__ == '__main__':
+    pass
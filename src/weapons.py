@@ -6,6 +6,9 @@
 
 """
 
+# Sys
+from copy import copy
+
 # Moine
 from .enumerators import (
     ActionPropertiesEnum, ExtrasEnum, MonsterPropertiesEnum,
@@ -63,6 +66,38 @@ class Weapon():
 
         return f"{self._name} {self._dice} {self._versatile}"
 
+    def copy_with_stats(self, stats):
+        """
+        Copies us onto another stats instance, sharing our weapon data.
+        """
+
+        # Shallow, all we change is stats
+        weapon = copy(self)
+        weapon._stats = stats
+
+        # Improvised/Versatile read stats too
+        if self._improvised is not None:
+            weapon._improvised = self._improvised.copy_with_stats(stats)
+        if self._versatile is not None:
+            weapon._versatile = self._versatile.copy_with_stats(stats)
+
+        # Return!
+        return weapon
+
+    def get_compound(self):
+        """
+        Gets the compound Weapons.create makes us from
+        """
+
+        return f"{self._name}_{self._scale}"
+
+    def get_dpr(self):
+        """
+        Gets our average damage per hit, including our stat bonus.
+        """
+
+        return self._dice.get_average() + self.get_stat_bonus()
+
     def get_extra(self, extra):
         """
         Gets the given Extra, if we have it.
@@ -93,9 +128,15 @@ class Weapon():
         Gets our Stat Bonus
         """
 
-        # STR/DEX Bonuses
-        str_stat_bonus = self._stats.get_stat_bonus(StatsEnum.STRENGTH.value)
-        dex_stat_bonus = self._stats.get_stat_bonus(StatsEnum.DEXTERITY.value)
+        return self.get_stat_bonus_from(
+            self._stats.get_stat_bonus(StatsEnum.STRENGTH.value),
+            self._stats.get_stat_bonus(StatsEnum.DEXTERITY.value)
+        )
+
+    def get_stat_bonus_from(self, str_stat_bonus, dex_stat_bonus):
+        """
+        Gets our Stat Bonus, given STR/DEX Bonuses
+        """
 
         # If this is a Finesse weapon, use the higher of STR/DE
         if self.has_action_property(ActionPropertiesEnum.FINESSE):
@@ -165,6 +206,19 @@ class Weapons():
 
         self._weapon_list.append(weapon)
 
+    def copy_with_stats(self, stats):
+        """
+        Copies us and our weapon list onto another stats instance, sharing
+        the weapon data table.
+        """
+
+        weapons = copy(self)
+        weapons._stats = stats
+        weapons._weapon_list = [
+            weapon.copy_with_stats(stats) for weapon in self._weapon_list
+        ]
+        return weapons
+
     def count(self, name=""):
         """
         How many weapons we have?
@@ -237,9 +291,7 @@ class Weapons():
         for weapon in self._weapon_list:
 
             # Damage Per Round
-            damage_per_round = max(
-                weapon._dice.get_average() + weapon.get_stat_bonus(),
-                damage_per_round)
+            damage_per_round = max(weapon.get_dpr(), damage_per_round)
 
         # Return
         return damage_per_round